@@ -3,6 +3,7 @@ import allure
 import logging
 
 from pages.base_page import BasePage
+from pages.selector_registry import selector
 
 log = logging.getLogger(__name__)
 
@@ -10,24 +11,24 @@ class AddTaskPage(BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
         self.page = page
-        self.task_name_input = page.locator("input[placeholder='Enter task name']")
-        self.task_description_textarea = page.locator("textarea[placeholder='Enter task description']")
-        self.task_deadline_input = page.locator("input[placeholder='Enter deadline date']")
-        self.category_dropdown = page.locator("div[role='combobox'][aria-haspopup='listbox']")
-        self.create_task_button = page.locator("button[type='button']", has_text="Create Task")
-        self.color_picker_toggle = page.locator("button.MuiAccordionSummary-root")
-        self.color_buttons = page.locator("button[id^='color-element-']")
-        self.sidebar_button = page.locator("button[aria-label='Sidebar']")
-        self.back_to_main_tasks = page.locator("button[aria-label='menu']")
-        self.validation_error_message = page.locator("p.MuiFormHelperText-root.Mui-error")
-        self.name_validation_error = page.locator("p[id$='-helper-text'].Mui-error")
+        self.task_name_input = page.locator(selector("add_task.task_name_input"))
+        self.task_description_textarea = page.locator(selector("add_task.task_description_textarea"))
+        self.task_deadline_input = page.locator(selector("add_task.task_deadline_input"))
+        self.category_dropdown = page.locator(selector("add_task.category_dropdown"))
+        self.create_task_button = page.locator(selector("add_task.create_task_button"))
+        self.color_picker_toggle = page.locator(selector("add_task.color_picker_toggle"))
+        self.color_buttons = page.locator(selector("add_task.color_buttons"))
+        self.sidebar_button = page.locator(selector("add_task.sidebar_button"))
+        self.back_to_main_tasks = page.locator(selector("add_task.back_to_main_tasks"))
+        self.validation_error_message = page.locator(selector("add_task.validation_error_message"))
+        self.name_validation_error = page.locator(selector("add_task.name_validation_error"))
 
     @allure.step("Submit task with name: {text}")
     def submit_task(self, text: str):
         log.info(f"Filling task name: '{text}'")
         self.fill(self.task_name_input, text)
         log.info("Clicking Create Task button")
-        self.wait_for()
+        self.wait_for_element_to_be_visible_and_clickable(self.create_task_button)
         self.click(self.create_task_button, force= True)
 
     @allure.step("Fill task name only: {text}")
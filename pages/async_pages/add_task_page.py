@@ -0,0 +1,55 @@
+import logging
+
+from playwright.async_api import Page
+
+from pages.async_pages.base_page import BasePage, step
+from pages.selector_registry import selector
+
+log = logging.getLogger(__name__)
+
+
+class AddTaskPage(BasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.page = page
+        self.task_name_input = page.locator(selector("add_task.task_name_input"))
+        self.task_description_textarea = page.locator(selector("add_task.task_description_textarea"))
+        self.task_deadline_input = page.locator(selector("add_task.task_deadline_input"))
+        self.category_dropdown = page.locator(selector("add_task.category_dropdown"))
+        self.create_task_button = page.locator(selector("add_task.create_task_button"))
+        self.color_picker_toggle = page.locator(selector("add_task.color_picker_toggle"))
+        self.color_buttons = page.locator(selector("add_task.color_buttons"))
+        self.sidebar_button = page.locator(selector("add_task.sidebar_button"))
+        self.back_to_main_tasks = page.locator(selector("add_task.back_to_main_tasks"))
+        self.validation_error_message = page.locator(selector("add_task.validation_error_message"))
+        self.name_validation_error = page.locator(selector("add_task.name_validation_error"))
+
+    @step("Submit task with name: {text}")
+    async def submit_task(self, text: str):
+        log.info(f"Filling task name: '{text}'")
+        await self.fill(self.task_name_input, text)
+        log.info("Clicking Create Task button")
+        await self.wait_for_element_to_be_visible_and_clickable(self.create_task_button)
+        await self.click(self.create_task_button, force=True)
+
+    @step("Fill task name only: {text}")
+    async def fill_task_name_only(self, text: str):
+        log.info(f"Filling task name field with: '{text}' (length: {len(text)} characters)")
+        await self.fill(self.task_name_input, text)
+
+    @step("Attempt to submit empty task")
+    async def submit_empty_task(self):
+        log.info("Clicking Create Task with empty input")
+        await self.wait_for_element_to_be_visible_and_clickable(self.create_task_button)
+        await self.click(self.create_task_button, force=True)
+
+    @step("Navigate back to main tasks")
+    async def navigate_to_main_tasks(self):
+        log.info("Navigate back to main tasks")
+        await self.wait_for_element_to_be_visible_and_clickable(self.back_to_main_tasks)
+        await self.click(self.back_to_main_tasks)
+
+    @step("Get validation error message for name field")
+    async def get_validation_error_message(self) -> str:
+        await self.wait_for_element_to_be_visible_locator(self.name_validation_error)
+        return await self.get_text(self.name_validation_error)
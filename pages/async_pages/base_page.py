@@ -0,0 +1,121 @@
+import functools
+import logging
+import time
+import weakref
+from typing import List
+from urllib.parse import urlparse
+
+from allure_commons.utils import func_parameters, represent
+from playwright.async_api import Page, Locator, expect
+
+from pages.base_page import DOM_SETTLED_SCRIPT, SERVICE_WORKER_READY_SCRIPT
+from pages.selector_registry import selector
+
+log = logging.getLogger(__name__)
+
+
+# Steps run on each Playwright page, i.e. by each simulated user
+_TIMELINES: "weakref.WeakKeyDictionary[Page, List[dict]]" = weakref.WeakKeyDictionary()
+
+
+def step_timeline(page: Page) -> List[dict]:
+    """Every step the async page objects ran on `page`, in start order."""
+    return _TIMELINES.setdefault(page, [])
+
+
+def step(title: str):
+    """Record a coroutine page-object method on its user's step timeline, titled like allure.step.
+
+    Allure parents each new step to the last one opened in the process, so steps
+    of users running under asyncio.gather would nest inside each other's. Steps
+    are kept per page instead, for the test to attach as one timeline per user.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            params = func_parameters(func, self, *args, **kwargs)
+            timeline = step_timeline(self.page)
+            entry = {
+                "step": title.format(*map(represent, (self, *args)), **params),
+                "depth": sum(1 for running in timeline if running["duration_ms"] is None),
+                "started": time.time(),
+                "duration_ms": None,
+                "status": "passed",
+            }
+            timeline.append(entry)
+            started = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception:
+                entry["status"] = "failed"
+                raise
+            finally:
+                entry["duration_ms"] = (time.perf_counter() - started) * 1000
+        return wrapper
+    return decorator
+
+
+class BasePage:
+    """asyncio counterpart of pages.base_page.BasePage with the same method surface."""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.preparing_offline_toast = page.locator(selector("base.preparing_offline_toast"))
+        self.offline_ready_toast = page.locator(selector("base.offline_ready_toast"))
+
+    async def click(self, element: Locator, force: bool = False):
+        """Click an element (expects a Locator)."""
+        await element.click(timeout=1000, force=force)
+
+    async def fill(self, element: Locator, text: str):
+        """Fill an input field (expects a Locator)."""
+        await element.fill(text)
+
+    async def get_text(self, element: Locator) -> str:
+        """Get the text content of an element (expects a Locator)."""
+        return await element.inner_text()
+
+    def _report_wait(self, description: str, started: float) -> float:
+        """Log how long a wait took and return it in milliseconds."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        log.info(f"Waited {elapsed_ms:.0f} ms for {description}")
+        return elapsed_ms
+
+    async def wait_for(self, timeout: int = 5000, quiet_period: int = 100) -> float:
+        """Wait for the DOM to stop mutating for `quiet_period` ms (bounded by `timeout`)."""
+        started = time.perf_counter()
+        settled = await self.page.evaluate(DOM_SETTLED_SCRIPT, [quiet_period, timeout])
+        if not settled:
+            log.warning(f"DOM kept mutating for {timeout} ms, continuing anyway")
+        return self._report_wait("DOM to settle", started)
+
+    async def wait_for_count_to_increase(self, element: Locator, previous_count: int, timeout: int = 5000) -> float:
+        """Wait until the locator matches more than `previous_count` elements."""
+        started = time.perf_counter()
+        await expect(element.nth(previous_count)).to_be_attached(timeout=timeout)
+        return self._report_wait(f"element count to exceed {previous_count}", started)
+
+    async def wait_for_route(self, path: str, timeout: int = 5000) -> float:
+        """Wait until the page URL path equals `path` (trailing slashes ignored)."""
+        started = time.perf_counter()
+        expected = path.rstrip("/")
+        await self.page.wait_for_url(lambda url: urlparse(url).path.rstrip("/") == expected, timeout=timeout)
+        return self._report_wait(f"route '{path or '/'}'", started)
+
+    async def wait_for_element_not_to_be_visible(self, timeout: int = 10000) -> float:
+        """Wait for the service worker to install and its offline toasts to disappear."""
+        started = time.perf_counter()
+        if await self.page.evaluate(SERVICE_WORKER_READY_SCRIPT, timeout):
+            await self.wait_for(timeout=timeout)
+        await expect(self.preparing_offline_toast).not_to_be_visible(timeout=timeout)
+        await expect(self.offline_ready_toast).not_to_be_visible(timeout=timeout)
+        return self._report_wait("service-worker toasts to disappear", started)
+
+    async def wait_for_element_to_be_visible_locator(self, element: Locator, timeout: int = 5000):
+        """Wait for an element to be visible (expects a locator)."""
+        await expect(element).to_be_visible(timeout=timeout)
+
+    async def wait_for_element_to_be_visible_and_clickable(self, element: Locator, timeout: int = 5000):
+        """Wait for an element to be visible and clickable (expects a locator)."""
+        await expect(element).to_be_visible(timeout=timeout)
+        await expect(element).to_be_enabled(timeout=timeout)
@@ -0,0 +1,58 @@
+from playwright.async_api import Page
+import logging
+
+from pages.async_pages.base_page import BasePage, step
+from pages.selector_registry import selector
+
+log = logging.getLogger(__name__)
+
+
+class EditTaskPage(BasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.page = page
+        self.dialog = page.locator(selector("edit_task.dialog"))
+        self.name_input = self.dialog.locator(selector("edit_task.name_input"))
+        self.description_textarea = self.dialog.locator(selector("edit_task.description_textarea"))
+        self.deadline_input = self.dialog.locator(selector("edit_task.deadline_input"))
+        self.category_dropdown = self.dialog.locator(selector("edit_task.category_dropdown"))
+        self.color_accordion = self.dialog.locator(selector("edit_task.color_accordion"))
+        self.color_buttons = self.dialog.locator(selector("edit_task.color_buttons"))
+        self.close_button = self.dialog.locator(selector("edit_task.close_button"))
+        self.cancel_button = self.dialog.locator(selector("edit_task.cancel_button"))
+        self.save_button = self.dialog.locator(selector("edit_task.save_button"))
+
+    @step("Wait for Edit Task dialog to be visible")
+    async def wait_for_ready(self):
+        await self.wait_for_element_to_be_visible_and_clickable(self.name_input)
+        await self.wait_for_element_to_be_visible_locator(self.save_button)
+
+    @step("Edit task with name: {name}")
+    async def edit_task(self, name: str, description: str = None, deadline: str = None):
+        await self.wait_for_ready()
+        await self.name_input.fill(name)
+        if description is not None:
+            await self.description_textarea.fill(description)
+        if deadline is not None:
+            await self.deadline_input.fill(deadline)
+        await self.save_button.click()
+
+    @step("Close edit dialog")
+    async def close_dialog(self):
+        await self.click(self.close_button)
+
+    @step("Cancel editing")
+    async def cancel_edit(self):
+        await self.click(self.cancel_button)
+
+    @step("Select category")
+    async def select_category(self):
+        await self.click(self.category_dropdown)
+
+    @step("Toggle color picker")
+    async def open_color_picker(self):
+        await self.click(self.color_accordion)
+
+    @step("Pick color by index {index}")
+    async def pick_color(self, index: int):
+        await self.color_buttons.nth(index).click()
@@ -0,0 +1,132 @@
+import re
+from typing import List
+
+from playwright.async_api import Page, expect
+from pages.async_pages.base_page import BasePage, step
+from pages.async_pages.add_task_page import AddTaskPage
+from pages.selector_registry import selector
+from pages.todo_page import TASK_ORDER_CHANGED_SCRIPT, TASK_SNAPSHOT_SCRIPT, TASK_TITLES_SCRIPT, TaskSnapshot
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class TodoPage(BasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.page = page
+        self.search_input = page.locator(selector("todo.search_input"))
+        self.sort_button = page.locator(selector("todo.sort_button"))
+        self.sort_options = {
+            "name": page.locator(selector("todo.sort_by_name")).first,
+            "date": page.locator(selector("todo.sort_by_date")).first,
+        }
+        self.task_items = page.locator(selector("todo.task_items"))
+        self.add_task_button = page.locator(selector("todo.add_task_button"))
+        self.task_title = page.locator(selector("todo.task_title"))
+        self.task_timestamp = page.locator(selector("todo.task_timestamp"))
+        self.task_menu_button = page.locator(selector("todo.task_menu_button"))
+        self.task_menu_button_string = selector("todo.task_menu_button")
+        self.edit_input = page.locator(selector("todo.edit_input"))
+        self.create_task_btn = page.locator(selector("todo.create_task_btn"))
+        self.edit_btn = page.locator(selector("todo.edit_btn"))
+        self.save_button = page.locator(selector("todo.save_button"))
+        self.delete_btn = page.locator(selector("todo.delete_btn"))
+        self.mark_as_done_btn = page.locator(selector("todo.mark_as_done_btn"))
+        self.confirm_delete_btn = page.locator(selector("todo.confirm_delete_btn"))
+        self.completed_info = page.locator(selector("todo.completed_info"))
+        self.all_tasks = page.locator(selector("todo.task_items"))
+
+    @step("Navigate to Add Task screen")
+    async def open_add_task_screen(self):
+        await self.click(self.add_task_button, force=True)
+        return AddTaskPage(self.page)
+
+    @step("Add task through /add screen: {text}")
+    async def add_task(self, text: str):
+        previous_count = await self.task_items.count()
+        form = await self.open_add_task_screen()
+        await self.wait_for_route("/add")
+        await self.wait_for_element_not_to_be_visible()
+        await form.submit_task(text)
+        await self.wait_for_route("/")
+        await self.wait_for_count_to_increase(self.task_items, previous_count)
+
+    @step("wait for add task button to be visible")
+    async def wait_for_add_task_button(self):
+        await self.wait_for_element_to_be_visible_and_clickable(self.add_task_button)
+        await self.wait_for()
+
+    @step("Snapshot all tasks on the board")
+    async def snapshot(self) -> List[TaskSnapshot]:
+        """Collect every task container's state with a single page evaluation."""
+        rows = await self.all_tasks.evaluate_all(TASK_SNAPSHOT_SCRIPT, selector("todo.task_done_icon"))
+        return [TaskSnapshot(*row) for row in rows]
+
+    @step("Get task titles in board order")
+    async def task_order(self) -> List[str]:
+        return await self.page.evaluate(TASK_TITLES_SCRIPT, selector("todo.task_title"))
+
+    @step("Get current task titles")
+    async def get_tasks(self):
+        return [task.title for task in await self.snapshot()]
+
+    @step("Mark task at index {index} as complete")
+    async def mark_complete(self, index: int):
+        await self.wait_for_element_to_be_visible_locator(self.task_items.nth(index))
+        await self.click(self.task_items.nth(index).locator(self.task_menu_button_string))
+        await self.click(self.mark_as_done_btn)
+
+    @step("Delete task at index {index}")
+    async def delete_task(self, index: int):
+        await self.click(self.task_items.nth(index).locator(self.task_menu_button_string))
+        await self.click(self.delete_btn)
+        await self.click(self.confirm_delete_btn)
+
+    @step("Edit task at index {index} to '{new_text}'")
+    async def edit_task(self, index: int, new_text: str):
+        await self.click(self.task_items.nth(index).locator(self.task_menu_button_string))
+        await self.click(self.edit_btn)
+        await self.fill(self.edit_input, new_text)
+        await self.click(self.save_button)
+
+    @step("Search tasks for '{text}'")
+    async def search_tasks(self, text: str):
+        await self.fill(self.search_input, text)
+        await self.wait_for()
+
+    @step("Type '{text}' into search one key at a time")
+    async def type_search(self, text: str, delay: int = 50):
+        await self.search_input.press_sequentially(text, delay=delay)
+
+    @step("Scroll the task list by {distance}px")
+    async def scroll_task_list(self, distance: int = 3000, steps: int = 20, interval: int = 16):
+        await self.all_tasks.first.hover()
+        for _ in range(steps):
+            await self.page.mouse.wheel(0, distance / steps)
+            await self.page.wait_for_timeout(interval)
+
+    @step("Sort tasks by {option}")
+    async def sort_tasks(self, option: str = "name", timeout: int = 5000):
+        before = await self.task_order()
+        await self.click(self.sort_button)
+        await self.click(self.sort_options[option])
+        await self.page.wait_for_function(TASK_ORDER_CHANGED_SCRIPT, arg=[selector("todo.task_title"), before],
+                                          timeout=timeout)
+
+    @step("Wait for {count} completed tasks in title")
+    async def wait_for_completed_count(self, count: int, timeout: int = 5000):
+        await expect(self.completed_info).to_have_text(re.compile(rf"completed\s+{count}\s+out"), timeout=timeout)
+
+    @step("Filter completed tasks from title")
+    async def filter_completed_from_title(self) -> int:
+        text = await self.completed_info.inner_text()
+        return int(text.split("completed")[1].split("out")[0].strip())
+
+    @step("Get number of visible tasks")
+    async def get_number_of_visible_tasks(self) -> int:
+        return sum(task.visible for task in await self.snapshot())
+
+    @step("Count completed tasks (by check icon presence)")
+    async def count_completed_tasks(self) -> int:
+        return sum(task.done for task in await self.snapshot())
@@ -1,9 +1,60 @@
+import logging
+import time
+from urllib.parse import urlparse
+
 from playwright.sync_api import Page, Locator, expect
 
+from pages.selector_registry import selector
+from utils.profiler import PROFILER, instrument, instrument_playwright
+
+log = logging.getLogger(__name__)
+
+# Resolves once the DOM has seen no mutation for `quietMs`, or when `timeoutMs` elapses
+DOM_SETTLED_SCRIPT = """
+([quietMs, timeoutMs]) => new Promise((resolve) => {
+    let quietTimer;
+    const finish = (settled) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(settled);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    quietTimer = setTimeout(() => finish(true), quietMs);
+    const deadline = setTimeout(() => finish(false), timeoutMs);
+})
+"""
+
+# Resolves true once the registered service worker is active, false when none is registered
+SERVICE_WORKER_READY_SCRIPT = """
+async (timeoutMs) => {
+    if (!('serviceWorker' in navigator) || !(await navigator.serviceWorker.getRegistration())) {
+        return false;
+    }
+    return Promise.race([
+        navigator.serviceWorker.ready.then(() => true),
+        new Promise((resolve) => setTimeout(() => resolve(false), timeoutMs))
+    ]);
+}
+"""
+
 
 class BasePage:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if PROFILER.enabled:
+            instrument(cls)
+
     def __init__(self, page: Page):
         self.page = page
+        self.preparing_offline_toast = page.locator(selector("base.preparing_offline_toast"))
+        self.offline_ready_toast = page.locator(selector("base.offline_ready_toast"))
 
     def click(self, element: Locator, force: bool = False):
         """Click an element (expects a Locator)."""
@@ -17,14 +68,41 @@ class BasePage:
         """Get the text content of an element (expects a Locator)."""
         return element.inner_text()
 
-    def wait_for(self, timeout: int = 1000):
-        """Wait for a page"""
-        self.page.wait_for_timeout(timeout=timeout)
+    def _report_wait(self, description: str, started: float) -> float:
+        """Log how long a wait took and return it in milliseconds."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        log.info(f"Waited {elapsed_ms:.0f} ms for {description}")
+        return elapsed_ms
 
-    def wait_for_element_not_to_be_visible(self):
-        self.wait_for(3000)
-        expect(self.page.locator("text=Preparing app for offline use...")).not_to_be_visible()
-        expect(self.page.locator("text=App is ready to work offline.")).not_to_be_visible()
+    def wait_for(self, timeout: int = 5000, quiet_period: int = 100) -> float:
+        """Wait for the DOM to stop mutating for `quiet_period` ms (bounded by `timeout`)."""
+        started = time.perf_counter()
+        settled = self.page.evaluate(DOM_SETTLED_SCRIPT, [quiet_period, timeout])
+        if not settled:
+            log.warning(f"DOM kept mutating for {timeout} ms, continuing anyway")
+        return self._report_wait("DOM to settle", started)
+
+    def wait_for_count_to_increase(self, element: Locator, previous_count: int, timeout: int = 5000) -> float:
+        """Wait until the locator matches more than `previous_count` elements."""
+        started = time.perf_counter()
+        expect(element.nth(previous_count)).to_be_attached(timeout=timeout)
+        return self._report_wait(f"element count to exceed {previous_count}", started)
+
+    def wait_for_route(self, path: str, timeout: int = 5000) -> float:
+        """Wait until the page URL path equals `path` (trailing slashes ignored)."""
+        started = time.perf_counter()
+        expected = path.rstrip("/")
+        self.page.wait_for_url(lambda url: urlparse(url).path.rstrip("/") == expected, timeout=timeout)
+        return self._report_wait(f"route '{path or '/'}'", started)
+
+    def wait_for_element_not_to_be_visible(self, timeout: int = 10000) -> float:
+        """Wait for the service worker to install and its offline toasts to disappear."""
+        started = time.perf_counter()
+        if self.page.evaluate(SERVICE_WORKER_READY_SCRIPT, timeout):
+            self.wait_for(timeout=timeout)
+        expect(self.preparing_offline_toast).not_to_be_visible(timeout=timeout)
+        expect(self.offline_ready_toast).not_to_be_visible(timeout=timeout)
+        return self._report_wait("service-worker toasts to disappear", started)
 
     def wait_for_element_to_be_visible_locator(self, element: Locator, timeout: int = 5000):
         """Wait for an element to be visible (expects a locator)."""
@@ -34,3 +112,8 @@ class BasePage:
         """Wait for an element to be visible and clickable (expects a locator)."""
         expect(element).to_be_visible(timeout=timeout)
         expect(element).to_be_enabled(timeout=timeout)
+
+
+if PROFILER.enabled:
+    instrument(BasePage)
+    instrument_playwright()
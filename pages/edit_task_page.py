@@ -3,6 +3,7 @@ import allure
 import logging
 
 from pages.base_page import BasePage
+from pages.selector_registry import selector
 
 log = logging.getLogger(__name__)
 
@@ -11,16 +12,16 @@ class EditTaskPage(BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
         self.page = page
-        self.dialog = page.locator("div[role='dialog']")
-        self.name_input = self.dialog.locator("input[name='name']")
-        self.description_textarea = self.dialog.locator("textarea[name='description']")
-        self.deadline_input = self.dialog.locator("input[type='datetime-local']")
-        self.category_dropdown = self.dialog.locator("div[role='combobox']")
-        self.color_accordion = self.dialog.locator("button.MuiAccordionSummary-root")
-        self.color_buttons = self.dialog.locator("button[id^='color-element-']")
-        self.close_button = self.dialog.locator("button >> nth=0")
-        self.cancel_button = self.dialog.locator("button:has-text('Cancel')")
-        self.save_button = self.dialog.locator("button:has-text('Save')")
+        self.dialog = page.locator(selector("edit_task.dialog"))
+        self.name_input = self.dialog.locator(selector("edit_task.name_input"))
+        self.description_textarea = self.dialog.locator(selector("edit_task.description_textarea"))
+        self.deadline_input = self.dialog.locator(selector("edit_task.deadline_input"))
+        self.category_dropdown = self.dialog.locator(selector("edit_task.category_dropdown"))
+        self.color_accordion = self.dialog.locator(selector("edit_task.color_accordion"))
+        self.color_buttons = self.dialog.locator(selector("edit_task.color_buttons"))
+        self.close_button = self.dialog.locator(selector("edit_task.close_button"))
+        self.cancel_button = self.dialog.locator(selector("edit_task.cancel_button"))
+        self.save_button = self.dialog.locator(selector("edit_task.save_button"))
 
     @allure.step("Wait for Edit Task dialog to be visible")
     def wait_for_ready(self):
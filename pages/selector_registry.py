@@ -0,0 +1,138 @@
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Entries the selector benchmark pinned away from their preferred strategy (usually back to the original
+# because no stable strategy matched the same elements), by selector name
+INDEX_PATH = Path(__file__).resolve().parent / "selector_index.json"
+
+# Playwright-only selector syntax that querySelector rejects: engine prefixes, chaining and pseudo-classes
+PLAYWRIGHT_SYNTAX = re.compile(
+    r"^\w+=|>>|:(has-text|text|text-is|text-matches|visible|nth-match|left-of|right-of|above|below|near)\("
+    r"|:visible\b"
+)
+
+
+# add_form is the /add screen after an empty submit, so its validation messages are showing
+STATES = ("board", "sort_menu", "task_menu", "edit_dialog", "delete_dialog", "add_form")
+
+
+def is_plain_css(strategy: str) -> bool:
+    return PLAYWRIGHT_SYNTAX.search(strategy) is None
+
+
+@dataclass(frozen=True)
+class SelectorEntry:
+    # Best first: stable hooks (data-testid, roles, aria labels) ahead of the selector the page was written with
+    strategies: Tuple[str, ...]
+    # Page state the elements exist in (one of STATES), so the benchmark can reach them
+    state: str = "board"
+    # Entry the page object scopes this one to, e.g. `self.dialog.locator(...)`
+    within: Optional[str] = None
+    # Used inside page scripts (querySelector), so every strategy must be plain CSS
+    css: bool = False
+
+    @property
+    def preferred(self) -> str:
+        return self.strategies[0]
+
+    @property
+    def original(self) -> str:
+        return self.strategies[-1]
+
+
+SELECTORS: Dict[str, SelectorEntry] = {
+    "base.preparing_offline_toast": SelectorEntry(("text=Preparing app for offline use...",)),
+    "base.offline_ready_toast": SelectorEntry(("text=App is ready to work offline.",)),
+
+    "todo.search_input": SelectorEntry(("input[placeholder='Search for task...']",)),
+    "todo.sort_button": SelectorEntry(("button:has-text('Sort')",)),
+    "todo.sort_by_name": SelectorEntry(("li:text-matches('name|alphabetical', 'i')",), state="sort_menu"),
+    "todo.sort_by_date": SelectorEntry(("li:text-matches('date created|creation date', 'i')",), state="sort_menu"),
+    "todo.task_items": SelectorEntry(("[data-testid='task-container']",)),
+    "todo.add_task_button": SelectorEntry(("button[aria-label='Add Task']",)),
+    "todo.task_title": SelectorEntry(("[data-testid='task-container'] h3",)),
+    "todo.task_timestamp": SelectorEntry(("[data-testid='task-container'] p",)),
+    "todo.task_menu_button": SelectorEntry(("[aria-label='Task Menu']",)),
+    "todo.task_done_icon": SelectorEntry(("[data-testid='DoneIcon']", "span.css-d6pu1g"),
+                                         within="todo.task_items", css=True),
+    "todo.edit_input": SelectorEntry(("input[name='name']",), state="edit_dialog"),
+    "todo.create_task_btn": SelectorEntry(("button:has-text('Create Task')",), state="add_form"),
+    # Scoping the text match to the open menu keeps it from scanning every <li> on the board
+    "todo.edit_btn": SelectorEntry(("[role='menu'] [role='menuitem']:has-text('Edit')", "li:has-text('Edit')"),
+                                   state="task_menu"),
+    "todo.delete_btn": SelectorEntry(("[role='menu'] [role='menuitem']:has-text('Delete')", "li:has-text('Delete')"),
+                                     state="task_menu"),
+    "todo.mark_as_done_btn": SelectorEntry(
+        ("[role='menu'] [role='menuitem']:has-text('Mark as done')", "li:has-text('Mark as done')"),
+        state="task_menu"
+    ),
+    "todo.save_button": SelectorEntry(("button:has-text('Save')",), state="edit_dialog"),
+    "todo.confirm_delete_btn": SelectorEntry(("button:has-text('Confirm Delete')",), state="delete_dialog"),
+    "todo.completed_info": SelectorEntry(("h4:has-text('You')",)),
+
+    "add_task.task_name_input": SelectorEntry(("input[placeholder='Enter task name']",), state="add_form"),
+    "add_task.task_description_textarea": SelectorEntry(("textarea[placeholder='Enter task description']",),
+                                                        state="add_form"),
+    "add_task.task_deadline_input": SelectorEntry(("input[placeholder='Enter deadline date']",), state="add_form"),
+    "add_task.category_dropdown": SelectorEntry(("div[role='combobox'][aria-haspopup='listbox']",), state="add_form"),
+    "add_task.create_task_button": SelectorEntry(("button[type='button']:has-text('Create Task')",), state="add_form"),
+    "add_task.color_picker_toggle": SelectorEntry(("button.MuiAccordionSummary-root",), state="add_form"),
+    "add_task.color_buttons": SelectorEntry(("button[id^='color-element-']",), state="add_form"),
+    "add_task.sidebar_button": SelectorEntry(("button[aria-label='Sidebar']",), state="add_form"),
+    "add_task.back_to_main_tasks": SelectorEntry(("button[aria-label='menu']",), state="add_form"),
+    "add_task.validation_error_message": SelectorEntry(("p.MuiFormHelperText-root.Mui-error",), state="add_form"),
+    "add_task.name_validation_error": SelectorEntry(("p[id$='-helper-text'].Mui-error",), state="add_form"),
+
+    "edit_task.dialog": SelectorEntry(("div[role='dialog']",), state="edit_dialog"),
+    "edit_task.name_input": SelectorEntry(("input[name='name']",), state="edit_dialog", within="edit_task.dialog"),
+    "edit_task.description_textarea": SelectorEntry(("textarea[name='description']",), state="edit_dialog",
+                                                    within="edit_task.dialog"),
+    "edit_task.deadline_input": SelectorEntry(("input[type='datetime-local']",), state="edit_dialog",
+                                              within="edit_task.dialog"),
+    "edit_task.category_dropdown": SelectorEntry(("div[role='combobox']",), state="edit_dialog",
+                                                 within="edit_task.dialog"),
+    "edit_task.color_accordion": SelectorEntry(("button.MuiAccordionSummary-root",), state="edit_dialog",
+                                               within="edit_task.dialog"),
+    "edit_task.color_buttons": SelectorEntry(("button[id^='color-element-']",), state="edit_dialog",
+                                             within="edit_task.dialog"),
+    "edit_task.close_button": SelectorEntry(("button[aria-label='close' i]", "button >> nth=0"), state="edit_dialog",
+                                            within="edit_task.dialog"),
+    "edit_task.cancel_button": SelectorEntry(("button:has-text('Cancel')",), state="edit_dialog",
+                                             within="edit_task.dialog"),
+    "edit_task.save_button": SelectorEntry(("button:has-text('Save')",), state="edit_dialog",
+                                           within="edit_task.dialog"),
+}
+
+
+def check_registry(selectors: Dict[str, SelectorEntry] = SELECTORS):
+    """Fail fast on an unknown state, or a strategy querySelector cannot run in an entry page scripts use."""
+    for name, entry in selectors.items():
+        if entry.state not in STATES:
+            raise ValueError(f"Selector '{name}' has unknown state '{entry.state}', expected one of {STATES}")
+        invalid = [strategy for strategy in entry.strategies if entry.css and not is_plain_css(strategy)]
+        if invalid:
+            raise ValueError(f"Selector '{name}' is used as plain CSS but has Playwright-only strategies: {invalid}")
+
+
+def load_index(path: Path = INDEX_PATH, selectors: Dict[str, SelectorEntry] = SELECTORS) -> Dict[str, str]:
+    """Read the benchmark's choices, keeping only registered strategies (plain CSS where the entry needs it)."""
+    index = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    return {
+        name: strategy for name, strategy in index.items()
+        if name in selectors and strategy in selectors[name].strategies
+        and (not selectors[name].css or is_plain_css(strategy))
+    }
+
+
+check_registry()
+
+
+_INDEX = load_index()
+
+
+def selector(name: str) -> str:
+    """The strategy to use for `name`: the one the benchmark pinned if indexed, else the preferred (first) one."""
+    return _INDEX.get(name, SELECTORS[name].preferred)
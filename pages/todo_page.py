@@ -1,33 +1,82 @@
+import re
+from dataclasses import dataclass
+from typing import List
+
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
 from pages.add_task_page import AddTaskPage
+from pages.selector_registry import selector
 import allure
 import logging
 
 log = logging.getLogger(__name__)
 
+# Reads every task container in one round trip; the check icon marks a completed task
+TASK_SNAPSHOT_SCRIPT = """
+(containers, doneIcon) => containers.map((el, index) => {
+    const rect = el.getBoundingClientRect();
+    const style = getComputedStyle(el);
+    const title = el.querySelector('h3');
+    const timestamp = el.querySelector('p');
+    return [
+        index,
+        title ? title.innerText : '',
+        timestamp ? timestamp.innerText : '',
+        el.querySelector(doneIcon) !== null,
+        rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden',
+        style.backgroundColor,
+    ];
+})
+"""
+
+
+# Task titles in board order; textContent avoids a layout pass per task on large boards
+TASK_TITLES_SCRIPT = "(titleSelector) => [...document.querySelectorAll(titleSelector)].map((el) => el.textContent)"
+
+# True once the titles are no longer in the order captured before an action (same tasks, new order)
+TASK_ORDER_CHANGED_SCRIPT = """
+([titleSelector, before]) => {
+    const titles = [...document.querySelectorAll(titleSelector)].map((el) => el.textContent);
+    return titles.length === before.length && titles.some((title, i) => title !== before[i]);
+}
+"""
+
+
+@dataclass(frozen=True)
+class TaskSnapshot:
+    index: int
+    title: str
+    timestamp: str
+    done: bool
+    visible: bool
+    color: str
+
 
 class TodoPage(BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
         self.page = page
-        self.search_input = page.locator("input[placeholder='Search for task...']")
-        self.sort_button = page.locator("button:has-text('Sort')")
-        self.task_items = page.locator("[data-testid='task-container']")
-        self.add_task_button = page.locator("button[aria-label='Add Task']")
-        self.task_title = page.locator("[data-testid='task-container'] h3")
-        self.task_timestamp = page.locator("[data-testid='task-container'] p")
-        self.task_menu_button = page.locator("[aria-label='Task Menu']")
-        self.task_menu_button_string = "[aria-label='Task Menu']"
-        self.edit_input = page.locator("input[name='name']")
-        self.create_task_btn = page.locator("button:has-text('Create Task')")
-        self.edit_btn = page.locator("li:has-text('Edit')")
-        self.save_button = page.locator("button:has-text('Save')")
-        self.delete_btn = page.locator("li:has-text('Delete')")
-        self.mark_as_done_btn = page.locator("li:has-text('Mark as done')")
-        self.confirm_delete_btn = page.locator("button:has-text('Confirm Delete')")
-        self.completed_info = page.locator("h4:has-text('You')")
-        self.all_tasks = page.locator('[data-testid="task-container"]')
+        self.search_input = page.locator(selector("todo.search_input"))
+        self.sort_button = page.locator(selector("todo.sort_button"))
+        self.sort_options = {
+            "name": page.locator(selector("todo.sort_by_name")).first,
+            "date": page.locator(selector("todo.sort_by_date")).first,
+        }
+        self.task_items = page.locator(selector("todo.task_items"))
+        self.add_task_button = page.locator(selector("todo.add_task_button"))
+        self.task_title = page.locator(selector("todo.task_title"))
+        self.task_timestamp = page.locator(selector("todo.task_timestamp"))
+        self.task_menu_button = page.locator(selector("todo.task_menu_button"))
+        self.task_menu_button_string = selector("todo.task_menu_button")
+        self.edit_input = page.locator(selector("todo.edit_input"))
+        self.create_task_btn = page.locator(selector("todo.create_task_btn"))
+        self.edit_btn = page.locator(selector("todo.edit_btn"))
+        self.save_button = page.locator(selector("todo.save_button"))
+        self.delete_btn = page.locator(selector("todo.delete_btn"))
+        self.mark_as_done_btn = page.locator(selector("todo.mark_as_done_btn"))
+        self.confirm_delete_btn = page.locator(selector("todo.confirm_delete_btn"))
+        self.completed_info = page.locator(selector("todo.completed_info"))
+        self.all_tasks = page.locator(selector("todo.task_items"))
 
     @allure.step("Navigate to Add Task screen")
     def open_add_task_screen(self):
@@ -36,20 +85,32 @@ class TodoPage(BasePage):
 
     @allure.step("Add task through /add screen: {text}")
     def add_task(self, text: str):
+        previous_count = self.task_items.count()
         form = self.open_add_task_screen()
+        self.wait_for_route("/add")
         self.wait_for_element_not_to_be_visible()
         form.submit_task(text)
-        self.wait_for()
+        self.wait_for_route("/")
+        self.wait_for_count_to_increase(self.task_items, previous_count)
 
     @allure.step("wait for add task button to be visible")
     def wait_for_add_task_button(self):
-        self.wait_for()
         self.wait_for_element_to_be_visible_and_clickable(self.add_task_button)
         self.wait_for()
 
+    @allure.step("Snapshot all tasks on the board")
+    def snapshot(self) -> List[TaskSnapshot]:
+        """Collect every task container's state with a single page evaluation."""
+        rows = self.all_tasks.evaluate_all(TASK_SNAPSHOT_SCRIPT, selector("todo.task_done_icon"))
+        return [TaskSnapshot(*row) for row in rows]
+
+    @allure.step("Get task titles in board order")
+    def task_order(self) -> List[str]:
+        return self.page.evaluate(TASK_TITLES_SCRIPT, selector("todo.task_title"))
+
     @allure.step("Get current task titles")
     def get_tasks(self):
-        return self.task_title.all_inner_texts()
+        return [task.title for task in self.snapshot()]
 
     @allure.step("Mark task at index {index} as complete")
     def mark_complete(self, index: int):
@@ -70,6 +131,40 @@ class TodoPage(BasePage):
         self.fill(self.edit_input, new_text)
         self.click(self.save_button)
 
+    @allure.step("Search tasks for '{text}'")
+    def search_tasks(self, text: str):
+        self.fill(self.search_input, text)
+        self.wait_for()
+
+    @allure.step("Type '{text}' into search one key at a time")
+    def type_search(self, text: str, delay: int = 50):
+        """Type like a user (one keystroke every `delay` ms) so each keystroke is its own interaction."""
+        self.search_input.press_sequentially(text, delay=delay)
+
+    @allure.step("Scroll the task list by {distance}px")
+    def scroll_task_list(self, distance: int = 3000, steps: int = 20, interval: int = 16):
+        """Wheel-scroll over the task list in `steps` increments, one every `interval` ms."""
+        self.all_tasks.first.hover()
+        for _ in range(steps):
+            self.page.mouse.wheel(0, distance / steps)
+            self.page.wait_for_timeout(interval)
+
+    @allure.step("Sort tasks by {option}")
+    def sort_tasks(self, option: str = "name", timeout: int = 5000):
+        """Apply a sort option and wait until the board is actually re-ordered.
+
+        The board must not already be in `option` order, or this times out.
+        """
+        before = self.task_order()
+        self.click(self.sort_button)
+        self.click(self.sort_options[option])
+        self.page.wait_for_function(TASK_ORDER_CHANGED_SCRIPT, arg=[selector("todo.task_title"), before],
+                                    timeout=timeout)
+
+    @allure.step("Wait for {count} completed tasks in title")
+    def wait_for_completed_count(self, count: int, timeout: int = 5000):
+        expect(self.completed_info).to_have_text(re.compile(rf"completed\s+{count}\s+out"), timeout=timeout)
+
     @allure.step("Filter completed tasks from title")
     def filter_completed_from_title(self) -> int:
         text = self.completed_info.inner_text()
@@ -77,13 +172,8 @@ class TodoPage(BasePage):
 
     @allure.step("Get number of visible tasks")
     def get_number_of_visible_tasks(self) -> int:
-        return sum(self.all_tasks.nth(i).is_visible() for i in range(self.all_tasks.count()))
+        return sum(task.visible for task in self.snapshot())
 
     @allure.step("Count completed tasks (by check icon presence)")
     def count_completed_tasks(self) -> int:
-        count = 0
-        for i in range(self.all_tasks.count()):
-            task = self.all_tasks.nth(i)
-            if task.locator("span.css-d6pu1g").count() > 0:
-                count += 1
-        return count
+        return sum(task.done for task in self.snapshot())
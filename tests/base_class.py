@@ -3,8 +3,12 @@ import os
 from dotenv import load_dotenv
 
 from pages.add_task_page import AddTaskPage
+from pages.async_pages.add_task_page import AddTaskPage as AsyncAddTaskPage
+from pages.async_pages.edit_task_page import EditTaskPage as AsyncEditTaskPage
+from pages.async_pages.todo_page import TodoPage as AsyncTodoPage
 from pages.edit_task_page import EditTaskPage
 from pages.todo_page import TodoPage
+from utils.task_seeder import TaskSeeder
 
 dot_env_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils", ".env"))
 load_dotenv(dotenv_path=dot_env_path)
@@ -15,4 +19,14 @@ class BaseClass:
         self.base_url = os.getenv("BASE_URL")
         self.todo_page = TodoPage(self.page)
         self.add_task_page = AddTaskPage(self.page)
-        self.edit_task_page = EditTaskPage(self.page)
\ No newline at end of file
+        self.edit_task_page = EditTaskPage(self.page)
+        self.task_seeder = TaskSeeder(self.page, self.todo_page.task_items)
+
+
+class AsyncBaseClass:
+    def __init__(self, page):
+        self.page = page
+        self.base_url = os.getenv("BASE_URL")
+        self.todo_page = AsyncTodoPage(self.page)
+        self.add_task_page = AsyncAddTaskPage(self.page)
+        self.edit_task_page = AsyncEditTaskPage(self.page)
@@ -1,68 +1,231 @@
 import allure
-import pytest
 import logging
+import pytest
 import os
+import time
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 from tests.base_class import BaseClass
+from utils import browser_server
+from utils.benchmark import BenchmarkReport
+from utils.metrics import MetricsCollector, check_budgets
+from utils.network_profile import PROFILES, NetworkRouter, network_profile, service_worker_mode
+from utils.profiler import PROFILER
+from utils.replay import attach_replay, throttle_replay
+from utils.sharding import DurationScheduler
+from utils.log_capture import configure_test_logging
+from utils.throttling import THROTTLE_PROFILES, compare_profiles, load_metric_records, save_comparison
+from utils.tracing import TraceRecorder, artifact_path, trace_mode
 
+log = logging.getLogger(__name__)
 log_dir = Path(__file__).resolve().parent.parent / "ui_tests-logs"
-log_dir.mkdir(parents=True, exist_ok=True)
-log_path = log_dir / "test.log"
+test_log_buffer, log_listener = configure_test_logging(log_dir)
+session_started = time.time()
 
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
 
-file_handler = logging.FileHandler(log_path, mode="w", encoding="utf-8")
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-file_handler.setFormatter(formatter)
-logging.getLogger().addHandler(file_handler)
-logging.getLogger().setLevel(logging.INFO)
+def pytest_addoption(parser):
+    parser.addoption("--benchmark", action="store_true", default=False,
+                     help="run the task-volume benchmarks (skipped by default)")
+    parser.addoption("--load", action="store_true", default=False,
+                     help="run the concurrent-user load tests (skipped by default)")
+    parser.addoption("--memory", action="store_true", default=False,
+                     help="run the memory-leak checks (skipped by default)")
+    parser.addoption("--shard", default=None,
+                     help="run only shard i of N (e.g. 2/4), balanced by recorded test durations")
+    parser.addoption("--throttle-profiles", default="desktop",
+                     help=f"comma-separated throttle profiles for throttle_profiles tests, or 'all' "
+                          f"({', '.join(THROTTLE_PROFILES)})")
+    parser.addoption("--update-benchmark-baseline", action="store_true", default=False,
+                     help="merge this run's benchmark results into benchmarks/baseline.json")
+    parser.addoption("--update-selector-index", action="store_true", default=False,
+                     help="pin selectors whose stable strategy failed verification in pages/selector_index.json")
 
 
-@pytest.fixture(scope="function", autouse=True)
-def initialize(request):
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "perf_budget(**limits): fail the test when a collected performance metric exceeds its limit"
+    )
+    config.addinivalue_line("markers", "benchmark: task-volume benchmark, only runs with --benchmark")
+    config.addinivalue_line("markers", "load: concurrent-user load test, only runs with --load")
+    config.addinivalue_line("markers", "memory: memory-leak check, only runs with --memory")
+    config.addinivalue_line("markers", "full_network: load every resource regardless of NETWORK_PROFILE")
+    config.addinivalue_line("markers", "service_worker: let the app register its offline service worker")
+    config.addinivalue_line(
+        "markers",
+        "throttle_profiles(*names): run the test under each selected CPU/network throttle profile"
+    )
+    config.pluginmanager.register(DurationScheduler(config), "duration-scheduler")
+    # first-retry traces the second attempt, which only exists when pytest-rerunfailures reruns failures
+    if trace_mode() == "first-retry" and not config.getoption("reruns", default=0):
+        raise pytest.UsageError("TRACE_MODE=first-retry needs pytest-rerunfailures and --reruns 1 or more")
+
+
+def pytest_unconfigure(config):
+    # The controller joins every worker's metrics, since profile variants of a test run on different workers
+    if not hasattr(config, "workerinput"):
+        save_comparison(compare_profiles(load_metric_records(since=session_started)))
+    PROFILER.save()
+    log_listener.stop()
+
+
+def pytest_generate_tests(metafunc):
+    marker = metafunc.definition.get_closest_marker("throttle_profiles")
+    if marker is None:
+        return
+    requested = metafunc.config.getoption("--throttle-profiles")
+    selected = list(THROTTLE_PROFILES) if requested == "all" else requested.split(",")
+    unknown = set(selected) - set(THROTTLE_PROFILES)
+    if unknown:
+        raise pytest.UsageError(f"Unknown throttle profiles: {', '.join(sorted(unknown))}")
+    supported = marker.args or tuple(THROTTLE_PROFILES)
+    metafunc.parametrize("throttle_profile", [name for name in selected if name in supported])
+
+
+def pytest_collection_modifyitems(config, items):
+    for marker in ("benchmark", "load", "memory"):
+        option = f"--{marker}"
+        if config.getoption(option):
+            continue
+        skip = pytest.mark.skip(reason=f"{marker} tests only run with {option}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def benchmark_report(request):
+    report = BenchmarkReport()
+    yield report
+    report.save(update_baseline=request.config.getoption("--update-benchmark-baseline"))
+
+
+@pytest.fixture(scope="session")
+def playwright_session():
+    """One Playwright driver per session (per worker under pytest-xdist)."""
     with sync_playwright() as playwright:
-        is_headless = os.getenv("HEADLESS", "false").lower() == "true"
+        yield playwright
+
 
-        window_args = ["--disable-blink-features=AutomationControlled"]
-        if not is_headless:
-            window_args.append("--start-maximized")
+@pytest.fixture(scope="session")
+def browser_session(playwright_session):
+    """One Chromium instance per session, shared by every test on this worker."""
+    is_headless = os.getenv("HEADLESS", "false").lower() == "true"
 
-        browser = playwright.chromium.launch(
+    # With BROWSER_SERVER=true, attach to the long-lived browser from `python -m utils.browser_server start`
+    browser = browser_server.connect(playwright_session) if browser_server.server_enabled() else None
+    if browser is None:
+        browser = playwright_session.chromium.launch(
             headless=is_headless,
-            args=window_args
+            args=browser_server.launch_args(is_headless)
         )
+    yield browser
+    # For an attached browser this only drops our contexts and disconnects
+    browser.close()
 
-        context = browser.new_context(
-            locale="en-US",
-            no_viewport=True
-        )
 
-        page = context.new_page()
+@pytest.fixture(scope="function")
+def throttle_profile():
+    """Unthrottled unless the test is parametrized through the throttle_profiles marker."""
+    return "desktop"
 
-        if not is_headless:
-            page.evaluate("window.moveTo(0, 0); window.resizeTo(screen.availWidth, screen.availHeight);")
-            window_size = page.evaluate("""() => { return { width: window.innerWidth, height: window.innerHeight }; }""")
-            page.set_viewport_size(window_size)
 
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+@pytest.fixture(scope="function", autouse=True)
+def initialize(request, browser_session, throttle_profile):
+    is_headless = os.getenv("HEADLESS", "false").lower() == "true"
 
-        base_class = BaseClass(page)
-        page.goto(base_class.base_url)
-        yield base_class
+    # A fresh context per test keeps cookies, storage and service workers isolated
+    context = browser_session.new_context(
+        locale="en-US",
+        no_viewport=True,
+        service_workers=service_worker_mode(request.node)
+    )
+    attach_replay(context)
+    throttle_replay(context, THROTTLE_PROFILES[throttle_profile])
 
+    profile = PROFILES["full"] if request.node.get_closest_marker("full_network") else network_profile()
+    network = NetworkRouter(context, profile)
+    network.start()
+
+    page = context.new_page()
+
+    if not is_headless:
+        page.evaluate("window.moveTo(0, 0); window.resizeTo(screen.availWidth, screen.availHeight);")
+        window_size = page.evaluate("""() => { return { width: window.innerWidth, height: window.innerHeight }; }""")
+        page.set_viewport_size(window_size)
+
+    # pytest-rerunfailures sets execution_count; without it every test is a first attempt
+    tracer = TraceRecorder(context, trace_mode(), attempt=getattr(request.node, "execution_count", 1))
+    tracer.start()
+
+    metrics = MetricsCollector(context, page)
+    metrics.start()
+    # Applied before navigation so the page load itself runs under the profile
+    THROTTLE_PROFILES[throttle_profile].apply(metrics.cdp)
+
+    base_class = BaseClass(page)
+    base_class.metrics = metrics
+    base_class.throttle_profile = throttle_profile
+    page.goto(base_class.base_url)
+    yield base_class
+
+    failed = hasattr(request.node, "rep_call") and request.node.rep_call.failed
+    try:
+        if failed:
+            screenshot_file = artifact_path("screenshots", request.node.nodeid, ".png")
+            page.screenshot(path=str(screenshot_file), full_page=True)
+            with screenshot_file.open("rb") as img:
+                allure.attach(img.read(), name="screenshot", attachment_type=allure.attachment_type.PNG)
+    finally:
+        network.report(metrics.transferred_bytes)
+        trace_file = tracer.stop(request.node.nodeid, failed)
+        if trace_file is not None:
+            allure.attach.file(str(trace_file), name="trace", extension="zip")
+        # Closing the context drops every page, storage entry and SW of this test
+        context.close()
+
+
+def comparison_key(item) -> str:
+    """The test id without its throttle profile, so runs under different profiles line up."""
+    callspec = getattr(item, "callspec", None)
+    params = {k: v for k, v in callspec.params.items() if k != "throttle_profile"} if callspec else {}
+    return item.nodeid.split("[")[0] + (f"{params}" if params else "")
+
+
+def report_metrics(item):
+    """Collect, attach and record the page metrics of a test that drove the sync page, else None."""
+    base_class = item.funcargs.get("initialize")
+    if base_class is None:
+        return None
+    metrics = base_class.metrics.collect()
+    base_class.metrics.report(item.nodeid, metrics, base_class.throttle_profile, comparison_key(item))
+    return metrics
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    try:
+        result = yield
+    except BaseException:
+        # A failing test's metrics matter most, but collecting them must not mask the failure
         try:
-            if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-                screenshots_path = Path("../screenshots")
-                screenshots_path.mkdir(parents=True, exist_ok=True)
-                screenshot_file = screenshots_path / f"{request.node.name}.png"
-                page.screenshot(path=str(screenshot_file), full_page=True)
-                with screenshot_file.open("rb") as img:
-                    allure.attach(img.read(), name="screenshot", attachment_type=allure.attachment_type.PNG)
-        finally:
-            context.tracing.stop(path="../trace/trace.zip")
-            browser.close()
+            report_metrics(item)
+        except Exception as error:
+            log.warning(f"Could not collect metrics after the failure: {error}")
+        raise
+    metrics = report_metrics(item)
+    marker = item.get_closest_marker("perf_budget")
+    # Budgets only judge tests that otherwise passed
+    if metrics is not None and marker is not None:
+        violations = check_budgets(metrics, marker.kwargs, item.funcargs["initialize"].throttle_profile)
+        assert not violations, "Performance budget exceeded: " + "; ".join(violations)
+    return result
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    test_log_buffer.start_test()
+    PROFILER.begin_test(item.nodeid)
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -71,10 +234,8 @@ def pytest_runtest_makereport(item):
     rep = outcome.get_result()
     if rep.when == "call":
         item.rep_call = rep
-        if log_path.exists():
-            with open(log_path, "r", encoding="utf-8") as log_file:
-                allure.attach(
-                    log_file.read(),
-                    name=f"log_{item.name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+        allure.attach(
+            test_log_buffer.text(),
+            name=f"log_{item.name}",
+            attachment_type=allure.attachment_type.TEXT
+        )
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import os
+
+import allure
+import pytest
+from playwright.async_api import async_playwright
+
+from pages.async_pages.base_page import step_timeline
+from tests.base_class import AsyncBaseClass
+from utils.async_runner import AsyncLoopThread
+from utils.network_profile import service_worker_mode
+from utils.replay import attach_replay_async
+
+
+@pytest.fixture(scope="function", autouse=True)
+def initialize():
+    """Load tests drive their own async pages, so skip the sync per-test page."""
+    return None
+
+
+@pytest.fixture(scope="session")
+def async_loop():
+    runner = AsyncLoopThread()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_loop):
+    is_headless = os.getenv("HEADLESS", "false").lower() == "true"
+    playwright = async_loop.run(async_playwright().start())
+    browser = async_loop.run(playwright.chromium.launch(
+        headless=is_headless,
+        args=["--disable-blink-features=AutomationControlled"]
+    ))
+    yield browser
+    async_loop.run(browser.close())
+    async_loop.run(playwright.stop())
+
+
+@pytest.fixture(scope="function")
+def async_users(request, async_loop, async_browser):
+    """Factory opening `count` isolated users (one context each) on the app concurrently.
+
+    Each user's page-object steps are attached as one `user_timelines` JSON at teardown.
+    """
+    contexts = []
+    users = []
+
+    async def open_user():
+        context = await async_browser.new_context(locale="en-US", service_workers=service_worker_mode(request.node))
+        contexts.append(context)
+        await attach_replay_async(context)
+        page = await context.new_page()
+        user = AsyncBaseClass(page)
+        await page.goto(user.base_url)
+        return user
+
+    def open_users(count: int):
+        opened = async_loop.run(asyncio.gather(*(open_user() for _ in range(count))))
+        users.extend(opened)
+        return opened
+
+    yield open_users
+    timelines = {f"user {i}": step_timeline(user.page) for i, user in enumerate(users)}
+    allure.attach(json.dumps(timelines, indent=2), name="user_timelines", attachment_type=allure.attachment_type.JSON)
+    async_loop.run(asyncio.gather(*(context.close() for context in contexts)))
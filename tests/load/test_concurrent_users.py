@@ -0,0 +1,47 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+import allure
+import logging
+
+from utils.benchmark import summarize
+
+log = logging.getLogger(__name__)
+
+USERS = int(os.getenv("LOAD_USERS", "50"))
+
+
+@allure.suite("Todo Web App Load Tests")
+@allure.label("layer", "ui")
+@allure.feature("Performance")
+@pytest.mark.load
+class TestConcurrentUsers:
+
+    @allure.story("Concurrent task creation")
+    @allure.title("Concurrent users add a task at once")
+    def test_concurrent_add_task(self, async_loop, async_users):
+        with allure.step(f"Open {USERS} isolated users"):
+            users = async_users(USERS)
+
+        async def add_task(user, i):
+            started = time.perf_counter()
+            await user.todo_page.add_task(f"User {i} task")
+            return (time.perf_counter() - started) * 1000
+
+        async def read_tasks():
+            return await asyncio.gather(*(user.todo_page.get_tasks() for user in users))
+
+        with allure.step(f"{USERS} users add a task concurrently"):
+            latencies = async_loop.run(asyncio.gather(*(add_task(user, i) for i, user in enumerate(users))))
+            summary = summarize(latencies)
+            log.info(f"Concurrent add latency over {USERS} users: {summary}")
+            allure.attach(json.dumps(summary, indent=2), name="concurrent_add_latency",
+                          attachment_type=allure.attachment_type.JSON)
+
+        with allure.step("Verify every user sees only their own task"):
+            boards = async_loop.run(read_tasks())
+            for i, tasks in enumerate(boards):
+                assert tasks == [f"User {i} task"], f"User {i} board is {tasks}"
@@ -0,0 +1,229 @@
+import pytest
+import allure
+import logging
+from playwright.sync_api import expect
+
+from pages.selector_registry import STATES
+from utils.benchmark import measure
+from utils.frame_timing import FrameSampler
+from utils.selector_cost import SelectorCostReport
+from utils.task_seeder import SeedTask
+
+log = logging.getLogger(__name__)
+
+BOARD_SIZES = [10, 100, 1000, 10000]
+WARMUP = 2
+ITERATIONS = 8
+JANK_BOARD_SIZES = [100, 1000, 10000]
+SORT_TOGGLES = 4
+SELECTOR_BOARD_SIZES = [10, 100, 1000, 10000]
+# Generous enough for a 10k-task board to re-render after each operation
+TIMEOUT = 60000
+
+
+def task_name(i: int) -> str:
+    return f"Task {i:05d}"
+
+
+def seed_board(initialize, board_size: int):
+    """Seed `board_size` tasks whose name order differs from their creation order, so sorting re-orders them."""
+    with allure.step(f"Seed board with {board_size} tasks"):
+        # 7919 is prime and coprime to every board size, so this visits each name exactly once
+        names = [task_name((i * 7919) % board_size) for i in range(board_size)]
+        initialize.task_seeder.seed(names, timeout=TIMEOUT)
+
+
+def next_sort_option(todo) -> str:
+    """The sort option that re-orders the board from its current order."""
+    titles = todo.task_order()
+    return "date" if titles == sorted(titles) else "name"
+
+
+@allure.suite("Todo Web App Benchmarks")
+@allure.label("layer", "ui")
+@allure.feature("Performance")
+@pytest.mark.benchmark
+@pytest.mark.full_network
+@pytest.mark.parametrize("board_size", BOARD_SIZES)
+class TestTaskVolumeBenchmarks:
+
+    @pytest.fixture(autouse=True)
+    def seeded_board(self, initialize, board_size):
+        seed_board(initialize, board_size)
+        return initialize
+
+    @allure.story("Add latency")
+    @allure.title("Add task latency on a board of {board_size}")
+    def test_add_latency(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+        samples = measure(lambda i: todo.add_task(f"Bench {i:03d}"), warmup=WARMUP, iterations=ITERATIONS)
+        benchmark_report.record("add", board_size, samples)
+
+    @allure.story("Edit latency")
+    @allure.title("Edit task latency on a board of {board_size}")
+    def test_edit_latency(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+
+        def edit(i):
+            new_name = f"Edited {i:03d}"
+            todo.edit_task(i, new_name)
+            expect(todo.task_title.filter(has_text=new_name)).to_have_count(1, timeout=TIMEOUT)
+
+        samples = measure(edit, warmup=WARMUP, iterations=ITERATIONS)
+        benchmark_report.record("edit", board_size, samples)
+
+    @allure.story("Complete latency")
+    @allure.title("Complete task latency on a board of {board_size}")
+    def test_complete_latency(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+
+        def first_open_task(i):
+            # The app may reorder completed tasks, so pick the target from a fresh snapshot (untimed)
+            return i + 1, next(task.index for task in todo.snapshot() if not task.done)
+
+        def complete(prepared):
+            completed, index = prepared
+            todo.mark_complete(index)
+            todo.wait_for_completed_count(completed, timeout=TIMEOUT)
+
+        samples = measure(complete, setup=first_open_task, warmup=WARMUP, iterations=ITERATIONS)
+        benchmark_report.record("complete", board_size, samples)
+
+    @allure.story("Delete latency")
+    @allure.title("Delete task latency on a board of {board_size}")
+    def test_delete_latency(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+
+        def delete(i):
+            todo.delete_task(0)
+            expect(todo.task_items).to_have_count(board_size - i - 1, timeout=TIMEOUT)
+
+        samples = measure(delete, warmup=WARMUP, iterations=ITERATIONS)
+        benchmark_report.record("delete", board_size, samples)
+
+    @allure.story("Search latency")
+    @allure.title("Search latency on a board of {board_size}")
+    def test_search_latency(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+
+        def reset_search(i):
+            todo.search_tasks("")
+            expect(todo.task_items).to_have_count(board_size, timeout=TIMEOUT)
+            return task_name((i * 7) % board_size)
+
+        def search(name):
+            todo.search_tasks(name)
+            expect(todo.task_items).to_have_count(1, timeout=TIMEOUT)
+
+        samples = measure(search, setup=reset_search, warmup=WARMUP, iterations=ITERATIONS)
+        benchmark_report.record("search", board_size, samples)
+
+    @allure.story("Sort latency")
+    @allure.title("Sort latency on a board of {board_size}")
+    def test_sort_latency(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+
+        # Alternate between name and creation order so every run re-orders the whole board
+        samples = measure(lambda option: todo.sort_tasks(option, timeout=TIMEOUT),
+                          setup=lambda i: next_sort_option(todo), warmup=WARMUP, iterations=ITERATIONS)
+        benchmark_report.record("sort", board_size, samples)
+
+
+@allure.suite("Todo Web App Benchmarks")
+@allure.label("layer", "ui")
+@allure.feature("Performance")
+@pytest.mark.benchmark
+@pytest.mark.full_network
+@pytest.mark.parametrize("board_size", JANK_BOARD_SIZES)
+class TestRenderingJank:
+
+    @pytest.fixture(autouse=True)
+    def seeded_board(self, initialize, board_size):
+        seed_board(initialize, board_size)
+        return initialize
+
+    @allure.story("Scroll jank")
+    @allure.title("Frame timing while scrolling a board of {board_size}")
+    def test_scroll_frames(self, initialize, benchmark_report, board_size):
+        frames = FrameSampler(initialize.page).measure(
+            f"scroll[{board_size}]", lambda: initialize.todo_page.scroll_task_list()
+        )
+        benchmark_report.record("scroll_frame", board_size, frames["deltas"])
+
+    @allure.story("Search jank")
+    @allure.title("Frame timing while typing a search on a board of {board_size}")
+    def test_search_typing_frames(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+        frames = FrameSampler(initialize.page).measure(
+            f"search_typing[{board_size}]", lambda: todo.type_search(task_name(board_size - 1))
+        )
+        expect(todo.task_items).to_have_count(1, timeout=TIMEOUT)
+        benchmark_report.record("search_typing_frame", board_size, frames["deltas"])
+
+    @allure.story("Sort jank")
+    @allure.title("Frame timing while toggling sort on a board of {board_size}")
+    def test_sort_toggle_frames(self, initialize, benchmark_report, board_size):
+        todo = initialize.todo_page
+
+        def toggle_sort():
+            # Alternate name and creation order so each toggle re-renders the whole board
+            for _ in range(SORT_TOGGLES):
+                todo.sort_tasks(next_sort_option(todo), timeout=TIMEOUT)
+
+        frames = FrameSampler(initialize.page).measure(f"sort_toggle[{board_size}]", toggle_sort)
+        benchmark_report.record("sort_toggle_frame", board_size, frames["deltas"])
+
+
+@allure.suite("Todo Web App Benchmarks")
+@allure.label("layer", "ui")
+@allure.feature("Performance")
+@pytest.mark.benchmark
+@pytest.mark.full_network
+class TestSelectorCost:
+
+    @staticmethod
+    def open_state(initialize, state: str):
+        """Bring up the menu, dialog or screen the state's selectors live in."""
+        todo = initialize.todo_page
+        if state == "sort_menu":
+            todo.click(todo.sort_button)
+        if state in ("task_menu", "edit_dialog", "delete_dialog"):
+            todo.click(todo.task_items.first.locator(todo.task_menu_button_string))
+        if state == "edit_dialog":
+            todo.click(todo.edit_btn)
+            initialize.edit_task_page.wait_for_ready()
+        if state == "delete_dialog":
+            todo.click(todo.delete_btn)
+            todo.wait_for_element_to_be_visible_locator(todo.confirm_delete_btn)
+        if state == "add_form":
+            # An empty submit brings up the validation messages the form's selectors include
+            todo.open_add_task_screen()
+            todo.wait_for_route("/add")
+            initialize.add_task_page.submit_empty_task()
+            initialize.add_task_page.wait_for_element_to_be_visible_locator(
+                initialize.add_task_page.name_validation_error
+            )
+
+    @staticmethod
+    def close_state(initialize, state: str):
+        if state == "add_form":
+            initialize.add_task_page.navigate_to_main_tasks()
+            initialize.todo_page.wait_for_route("/")
+        else:
+            initialize.page.keyboard.press("Escape")
+
+    @allure.story("Selector cost")
+    @allure.title("Selector resolution time as the board grows")
+    def test_selector_resolution_cost(self, request, initialize):
+        report = SelectorCostReport()
+        for board_size in SELECTOR_BOARD_SIZES:
+            with allure.step(f"Seed board with {board_size} tasks"):
+                # Some tasks done, so the completion-icon strategies have something to match
+                tasks = [SeedTask(task_name(i), done=i % 3 == 0) for i in range(board_size)]
+                initialize.task_seeder.seed(tasks, timeout=TIMEOUT)
+            for state in STATES:
+                with allure.step(f"Resolve {state} selectors on a board of {board_size}"):
+                    self.open_state(initialize, state)
+                    report.measure_state(initialize.page, state, board_size)
+                    self.close_state(initialize, state)
+        report.save(update_index=request.config.getoption("--update-selector-index"))
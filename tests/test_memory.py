@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+import allure
+import logging
+from playwright.sync_api import expect
+
+from utils.memory import MemorySampler, diff_summaries
+
+log = logging.getLogger(__name__)
+
+CYCLES = int(os.getenv("LEAK_CYCLES", "20"))
+# Cycles run before the baseline so lazy-loaded code and first-render caches are not counted as leaks
+WARMUP_CYCLES = 3
+# Retained growth allowed per add -> edit -> complete -> delete cycle
+BUDGETS_PER_CYCLE = {
+    "js_heap_used_bytes": 20_000,
+    "dom_nodes": 1,
+    "event_listeners": 0.5,
+}
+
+
+@allure.suite("Todo Web App Memory")
+@allure.label("layer", "ui")
+@allure.feature("Performance")
+@pytest.mark.memory
+class TestTaskLifecycleMemory:
+
+    @allure.story("Memory leak detection")
+    @allure.title("Task lifecycle cycles do not retain memory")
+    def test_task_lifecycle_does_not_leak(self, initialize):
+        todo = initialize.todo_page
+        sampler = MemorySampler(initialize.metrics.cdp)
+
+        def cycle(i):
+            name = f"Leak check {i:03d}"
+            todo.add_task(name)
+            todo.edit_task(0, f"{name} edited")
+            expect(todo.task_title.filter(has_text=f"{name} edited")).to_have_count(1)
+            todo.mark_complete(0)
+            todo.wait_for_completed_count(1)
+            todo.delete_task(0)
+            expect(todo.task_items).to_have_count(0)
+
+        with allure.step(f"Warm up with {WARMUP_CYCLES} cycles"):
+            for i in range(WARMUP_CYCLES):
+                cycle(i)
+            baseline_heap = sampler.heap_summary()
+            sampler.sample()
+
+        with allure.step(f"Run {CYCLES} add -> edit -> complete -> delete cycles"):
+            for i in range(CYCLES):
+                cycle(WARMUP_CYCLES + i)
+                sampler.sample()
+
+        growth = sampler.growth_per_cycle()
+        log.info(f"Retained growth per cycle: {growth}")
+        sampler.attach()
+        violations = [f"{name}: {growth[name]:.2f}/cycle exceeds budget {limit}"
+                      for name, limit in BUDGETS_PER_CYCLE.items() if growth[name] > limit]
+        if violations:
+            allure.attach(
+                json.dumps(diff_summaries(baseline_heap, sampler.heap_summary()), indent=2),
+                name="heap_snapshot_diff",
+                attachment_type=allure.attachment_type.JSON
+            )
+        assert not violations, "Memory grows across task lifecycles: " + "; ".join(violations)
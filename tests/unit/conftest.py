@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="function", autouse=True)
+def initialize():
+    """Unit tests need no browser, so skip the per-test page."""
+    return None
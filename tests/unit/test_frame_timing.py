@@ -0,0 +1,24 @@
+from utils.frame_timing import describe_input_latency, summarize_frames
+
+
+def recording(*events):
+    return {"frames": [16.7, 16.6, 50.0], "longFrames": [{"duration": 60, "blocking": 10}], "events": list(events)}
+
+
+def test_latency_is_reported_per_interaction():
+    summary = summarize_frames(recording(
+        {"name": "keydown", "interaction": 1, "duration": 24},
+        {"name": "keyup", "interaction": 1, "duration": 40},
+        {"name": "keydown", "interaction": 2, "duration": 18},
+        {"name": "wheel", "interaction": "wheel-1200", "duration": 30},
+    ))
+    assert summary["input_to_paint_ms"] == [40, 18, 30]
+    assert summary["input_to_paint_p50_ms"] == 30
+    assert summary["dropped_frames"] == 2
+    assert "over 3 interactions" in describe_input_latency(summary)
+
+
+def test_no_slow_input_is_described_not_none():
+    summary = summarize_frames(recording())
+    assert summary["input_to_paint_p95_ms"] is None
+    assert describe_input_latency(summary) == "no input took 16 ms or more to paint"
@@ -0,0 +1,202 @@
+import subprocess
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from utils.impact import DependencyMap, changed_lines, select_tests
+
+PROJECT = {
+    "pages/__init__.py": "",
+    "pages/selector_registry.py": """
+        from dataclasses import dataclass
+
+
+        @dataclass(frozen=True)
+        class SelectorEntry:
+            strategies: tuple
+
+
+        SELECTORS = {
+            "base.toast": SelectorEntry(("text=Saved",)),
+            "base.unused": SelectorEntry(("text=Never",)),
+        }
+
+
+        def selector(name):
+            return SELECTORS[name].strategies[-1]
+    """,
+    "pages/base_page.py": """
+        from pages.selector_registry import selector
+
+
+        class BasePage:
+            def __init__(self, page):
+                self.page = page
+                self.toast = page.locator(selector("base.toast"))
+
+            def click(self, element):
+                element.click()
+    """,
+    "pages/todo_page.py": """
+        from pages.base_page import BasePage
+
+        ADD_SCRIPT = "() => true"
+
+
+        class TodoPage(BasePage):
+            def __init__(self, page):
+                super().__init__(page)
+                self.dialog = page.locator("div[role='dialog']")
+                self.name_input = self.dialog.locator("input")
+                self.sort_button = page.locator("button")
+
+            def add_task(self):
+                self.page.evaluate(ADD_SCRIPT)
+                self.click(self.name_input)
+                self.click(self.toast)
+
+            def sort_tasks(self):
+                self.click(self.sort_button)
+    """,
+    "utils/__init__.py": "",
+    "utils/reader.py": """
+        from pages.selector_registry import SELECTORS
+
+
+        def count():
+            return len(SELECTORS)
+    """,
+    "tests/__init__.py": "",
+    "tests/base_class.py": """
+        from pages.todo_page import TodoPage
+
+
+        class BaseClass:
+            def __init__(self, page):
+                self.todo_page = TodoPage(page)
+    """,
+    "tests/test_flows.py": """
+        from utils.reader import count
+
+
+        def test_add(initialize):
+            initialize.todo_page.add_task()
+
+
+        def test_sort(initialize):
+            todo = initialize.todo_page
+            todo.sort_tasks()
+
+
+        def test_registry(initialize):
+            assert count()
+
+
+        def test_without_page():
+            assert True
+    """,
+}
+
+ADD = "tests/test_flows.py::test_add"
+SORT = "tests/test_flows.py::test_sort"
+REGISTRY = "tests/test_flows.py::test_registry"
+UNMAPPED = "tests/test_flows.py::test_without_page"
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    for file, source in PROJECT.items():
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source).lstrip(), encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def dep_map(project: Path) -> DependencyMap:
+    return DependencyMap(root=project)
+
+
+def line_of(project: Path, file: str, text: str) -> int:
+    lines = (project / file).read_text(encoding="utf-8").splitlines()
+    return next(number for number, line in enumerate(lines, start=1) if text in line)
+
+
+def selection(dep_map: DependencyMap, project: Path, file: str, text: str):
+    return select_tests(dep_map, {file: {line_of(project, file, text)}})[0]
+
+
+def test_module_constant_change_selects_its_readers(dep_map, project):
+    assert selection(dep_map, project, "pages/todo_page.py", "ADD_SCRIPT =") == {ADD, UNMAPPED}
+
+
+def test_method_change_selects_its_callers(dep_map, project):
+    assert selection(dep_map, project, "pages/todo_page.py", "self.click(self.sort_button)") == {SORT, UNMAPPED}
+
+
+def test_class_level_change_selects_every_user_of_the_class(dep_map, project):
+    assert selection(dep_map, project, "pages/todo_page.py", "class TodoPage") == {ADD, SORT, UNMAPPED}
+
+
+def test_attribute_change_follows_attributes_built_from_it(dep_map, project):
+    assert selection(dep_map, project, "pages/todo_page.py", "self.dialog =") == {ADD, UNMAPPED}
+
+
+def test_inherited_attribute_change_selects_subclass_users(dep_map, project):
+    assert ADD in selection(dep_map, project, "pages/base_page.py", "self.toast =")
+
+
+def test_registry_entry_selects_its_users_and_registry_readers(dep_map, project):
+    selected = selection(dep_map, project, "pages/selector_registry.py", '"base.toast"')
+    assert selected == {ADD, REGISTRY, UNMAPPED}
+
+
+def test_unused_registry_entry_still_selects_registry_readers(dep_map, project):
+    assert selection(dep_map, project, "pages/selector_registry.py", '"base.unused"') == {REGISTRY, UNMAPPED}
+
+
+def test_registry_code_outside_selectors_runs_everything(dep_map, project):
+    assert selection(dep_map, project, "pages/selector_registry.py", "class SelectorEntry") is None
+    assert selection(dep_map, project, "pages/selector_registry.py", "def selector") is None
+
+
+def test_test_body_change_selects_only_that_test(dep_map, project):
+    assert selection(dep_map, project, "tests/test_flows.py", "todo.sort_tasks()") == {SORT}
+
+
+def test_test_module_change_outside_tests_selects_the_whole_file(dep_map, project):
+    assert selection(dep_map, project, "tests/test_flows.py", "from utils.reader") == {ADD, SORT, REGISTRY, UNMAPPED}
+
+
+def test_documentation_changes_select_nothing(dep_map):
+    assert select_tests(dep_map, {"README.md": {1}, "LICENSE": {1}})[0] == set()
+
+
+@pytest.mark.parametrize("file", ["requirements.txt", "tests/conftest.py", "pytest.ini",
+                                  ".github/workflows/workflow.yml", "utils/reader.py"])
+def test_files_outside_the_map_run_everything(dep_map, file):
+    assert select_tests(dep_map, {file: {1}})[0] is None
+
+
+def test_deleted_page_module_runs_everything(dep_map):
+    assert select_tests(dep_map, {"pages/todo_page.py": None})[0] is None
+
+
+def test_changed_lines_reads_the_diff_and_new_modules(project):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=project, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("add", "-A")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "project")
+    todo = project / "pages/todo_page.py"
+    todo.write_text(todo.read_text(encoding="utf-8").replace('locator("button")', 'locator("button.sort")'), encoding="utf-8")
+    (project / "pages/new_page.py").write_text("X = 1\n", encoding="utf-8")
+    (project / "run.log").write_text("noise\n", encoding="utf-8")
+
+    changes = changed_lines("HEAD", root=project)
+
+    assert changes["pages/todo_page.py"] == {line_of(project, "pages/todo_page.py", "button.sort")}
+    assert "pages/new_page.py" in changes
+    assert "run.log" not in changes
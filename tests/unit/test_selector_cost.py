@@ -0,0 +1,40 @@
+import json
+
+from utils.selector_cost import SelectorCostReport
+
+
+def test_selectors_that_matched_nothing_are_not_compared():
+    report = SelectorCostReport()
+    strategies = {"[role='menu'] [role='menuitem']:has-text('Edit')": (0.1, 9.0, 1),
+                  "li:has-text('Edit')": (0.1, 5.0, 1)}
+    for strategy, (small, large, count) in strategies.items():
+        report.results.setdefault("todo.edit_btn", {})[strategy] = {
+            10: {"ms": small, "count": count}, 10000: {"ms": large, "count": count},
+        }
+    report.results["todo.confirm_delete_btn"] = {"button:has-text('Confirm Delete')": {
+        10: {"ms": 0.1, "count": 0}, 10000: {"ms": 9.0, "count": 0},
+    }}
+
+    assert report.matched("todo.edit_btn")
+    assert not report.matched("todo.confirm_delete_btn")
+    assert {name for name, _, _ in report.flagged()} == {"todo.edit_btn"}
+    assert report.verified_strategy("todo.edit_btn") == "[role='menu'] [role='menuitem']:has-text('Edit')"
+    assert report.verified_strategy("todo.confirm_delete_btn") is None
+
+
+def test_index_pins_only_entries_whose_preferred_strategy_failed(tmp_path, monkeypatch):
+    index_path = tmp_path / "selector_index.json"
+    monkeypatch.setattr("utils.selector_cost.INDEX_PATH", index_path)
+    monkeypatch.setattr("utils.selector_cost.BENCHMARK_DIR", tmp_path)
+    monkeypatch.setattr("utils.selector_cost.load_index", lambda: {"todo.edit_btn": "li:has-text('Edit')"})
+    report = SelectorCostReport()
+    report.results["todo.edit_btn"] = {
+        "[role='menu'] [role='menuitem']:has-text('Edit')": {10: {"ms": 0.1, "count": 1}},
+        "li:has-text('Edit')": {10: {"ms": 0.2, "count": 1}},
+    }
+    report.results["todo.task_done_icon"] = {
+        "[data-testid='DoneIcon']": {10: {"ms": 0.1, "count": 0}},
+        "span.css-d6pu1g": {10: {"ms": 0.2, "count": 3}},
+    }
+    report.save(update_index=True)
+    assert json.loads(index_path.read_text(encoding="utf-8")) == {"todo.task_done_icon": "span.css-d6pu1g"}
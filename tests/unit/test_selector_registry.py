@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from pages.selector_registry import SELECTORS, SelectorEntry, check_registry, is_plain_css, load_index
+
+
+@pytest.mark.parametrize("strategy", [
+    "[data-testid='DoneIcon']",
+    "span.css-d6pu1g",
+    "[role='menu'] [role='menuitem']",
+    "button[id^='color-element-']",
+])
+def test_plain_css_accepted(strategy):
+    assert is_plain_css(strategy)
+
+
+@pytest.mark.parametrize("strategy", [
+    "text=Saved",
+    "button >> nth=0",
+    "button:has-text('Save')",
+    "li:text-matches('name', 'i')",
+    "li:visible",
+])
+def test_playwright_syntax_rejected(strategy):
+    assert not is_plain_css(strategy)
+
+
+def test_registry_css_entries_are_plain_css():
+    check_registry()
+    assert all(is_plain_css(strategy) for entry in SELECTORS.values() if entry.css for strategy in entry.strategies)
+
+
+def test_css_entry_with_playwright_strategy_fails():
+    with pytest.raises(ValueError, match="icon"):
+        check_registry({"icon": SelectorEntry(("span:has-text('x')", "span.icon"), css=True)})
+
+
+def test_index_drops_unregistered_and_non_css_choices(tmp_path):
+    selectors = {
+        "icon": SelectorEntry(("[data-testid='Icon']", "span.icon"), css=True),
+        "button": SelectorEntry(("button:has-text('Save')", "button.save")),
+    }
+    path = tmp_path / "selector_index.json"
+    path.write_text(json.dumps({
+        "icon": "span:has-text('x')",
+        "button": "button:has-text('Save')",
+        "gone": "div",
+    }), encoding="utf-8")
+    assert load_index(path, selectors) == {"button": "button:has-text('Save')"}
+
+    path.write_text(json.dumps({"icon": "[data-testid='Icon']"}), encoding="utf-8")
+    assert load_index(path, selectors) == {"icon": "[data-testid='Icon']"}
@@ -0,0 +1,40 @@
+import json
+from types import SimpleNamespace
+
+from utils import sharding
+from utils.sharding import DurationScheduler, merge_durations, partition
+
+
+def test_partition_is_balanced_and_complete():
+    durations = {"a": 10, "b": 6, "c": 4, "d": 3, "e": 1}
+    buckets = partition(list(durations), durations, 2)
+    assert sorted(node for bucket in buckets for node in bucket) == sorted(durations)
+    assert sorted(sum(durations[node] for node in bucket) for bucket in buckets) == [11, 13]
+
+
+def test_merge_takes_only_what_each_shard_measured():
+    base = {"a": 1.0, "b": 2.0, "c": 3.0}
+    shard_one = {"a": 1.5, "b": 2.0, "c": 3.0}
+    shard_two = {"a": 1.0, "b": 2.0, "c": 9.0, "d": 4.0}
+    assert merge_durations(base, [shard_one, shard_two]) == {"a": 1.5, "b": 2.0, "c": 9.0, "d": 4.0}
+
+
+def test_skipped_tests_keep_their_recorded_duration(tmp_path, monkeypatch):
+    path = tmp_path / ".test-durations.json"
+    path.write_text('{"tests/test_benchmarks.py::test_slow": 120.0}', encoding="utf-8")
+    monkeypatch.setattr(sharding, "DURATIONS_PATH", path)
+    monkeypatch.setattr(sharding, "load_durations", lambda: json.loads(path.read_text(encoding="utf-8")))
+    scheduler = DurationScheduler(SimpleNamespace(getoption=lambda name: None))
+    for when, outcome, duration in (("setup", "skipped", 0.001), ("teardown", "passed", 0.001)):
+        scheduler.pytest_runtest_logreport(SimpleNamespace(
+            nodeid="tests/test_benchmarks.py::test_slow", when=when, duration=duration,
+            skipped=outcome == "skipped",
+        ))
+    scheduler.pytest_runtest_logreport(SimpleNamespace(
+        nodeid="tests/test_tasks.py::test_fast", when="call", duration=2.0, skipped=False,
+    ))
+    scheduler.pytest_sessionfinish(None)
+    assert json.loads(path.read_text(encoding="utf-8")) == {
+        "tests/test_benchmarks.py::test_slow": 120.0,
+        "tests/test_tasks.py::test_fast": 2.0,
+    }
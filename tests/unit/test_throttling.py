@@ -0,0 +1,35 @@
+import json
+
+from utils.throttling import THROTTLE_PROFILES, compare_profiles, load_metric_records
+
+
+def write_records(path, *records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+
+def record(key, profile, load, timestamp):
+    return {"test": f"{key}[{profile}]", "comparison_key": key, "timestamp": timestamp,
+            "throttle_profile": profile, "metrics": {"load_event_end": load}}
+
+
+def test_profiles_from_different_workers_are_joined(tmp_path):
+    write_records(tmp_path / "metrics-gw0.jsonl", record("test_load", "desktop", 900, 10))
+    write_records(tmp_path / "metrics-gw1.jsonl", record("test_load", "low_end_slow_3g", 9000, 11),
+                  record("test_other", "desktop", 500, 12))
+    assert compare_profiles(load_metric_records(tmp_path)) == {
+        "test_load": {"desktop": {"load_event_end": 900}, "low_end_slow_3g": {"load_event_end": 9000}},
+    }
+
+
+def test_older_runs_are_left_out(tmp_path):
+    write_records(tmp_path / "metrics-gw0.jsonl", record("test_load", "desktop", 900, 10),
+                  record("test_load", "desktop", 800, 20))
+    write_records(tmp_path / "metrics-gw1.jsonl", record("test_load", "low_end_slow_3g", 9000, 21))
+    assert compare_profiles(load_metric_records(tmp_path, since=15))["test_load"]["desktop"] == {"load_event_end": 800}
+    assert compare_profiles(load_metric_records(tmp_path, since=21)) == {}
+
+
+def test_transfer_time_adds_latency_and_throughput():
+    assert THROTTLE_PROFILES["desktop"].transfer_ms(1_000_000) == 0
+    assert THROTTLE_PROFILES["mid_tier_fast_3g"].transfer_ms(180_000) == 562.5 + 1000
+    assert THROTTLE_PROFILES["low_end_slow_3g"].transfer_ms(0, 25_000) == 2000 + 500
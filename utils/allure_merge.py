@@ -0,0 +1,38 @@
+import argparse
+import shutil
+from pathlib import Path
+from typing import List
+
+
+def merge_results(sources: List[Path], destination: Path) -> int:
+    """Copy every shard's allure-results into one directory and return the number of files copied.
+
+    Result and attachment files carry unique UUID names, so they never collide; for
+    shared files such as environment.properties or categories.json the first shard wins.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    for source in sources:
+        for file in source.rglob("*"):
+            if not file.is_file():
+                continue
+            target = destination / file.relative_to(source)
+            if target.exists():
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(file, target)
+            copied += 1
+    return copied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge per-shard allure-results directories")
+    parser.add_argument("sources", nargs="+", type=Path, help="allure-results directories of each shard")
+    parser.add_argument("-o", "--output", type=Path, default=Path("allure-results"), help="merged directory")
+    args = parser.parse_args()
+    copied = merge_results(args.sources, args.output)
+    print(f"Merged {copied} files from {len(args.sources)} shards into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import asyncio
+import threading
+from typing import Any, Awaitable
+
+
+class AsyncLoopThread:
+    """Runs an asyncio event loop on a background thread.
+
+    Keeps the async Playwright driver apart from the sync one the rest of the
+    suite uses on the main thread, while tests stay plain sync functions.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="async-playwright", daemon=True)
+        self.thread.start()
+
+    def run(self, coroutine: Awaitable[Any]) -> Any:
+        """Run `coroutine` on the loop and block until it returns."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
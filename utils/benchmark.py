@@ -0,0 +1,104 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import allure
+
+log = logging.getLogger(__name__)
+
+BENCHMARK_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Linearly interpolated percentile of `samples` (pct in 0-100)."""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Reduce latency samples (ms) to the figures kept in the report."""
+    return {
+        "count": len(samples),
+        "mean": sum(samples) / len(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+    }
+
+
+def measure(action: Callable[[Any], None], setup: Callable[[int], Any] = lambda i: i,
+            warmup: int = 2, iterations: int = 8) -> List[float]:
+    """Time `action` over warmup + iterations runs and return the measured latencies in ms.
+
+    `setup(i)` runs untimed before each run and its result is passed to `action`.
+    """
+    samples = []
+    for i in range(warmup + iterations):
+        prepared = setup(i)
+        started = time.perf_counter()
+        action(prepared)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if i >= warmup:
+            samples.append(elapsed_ms)
+    return samples
+
+
+class BenchmarkReport:
+    """Collects benchmark summaries for a session and compares them with the stored baseline."""
+
+    def __init__(self, baseline_path: Path = BASELINE_PATH, tolerance: float = 1.2):
+        self.baseline_path = baseline_path
+        self.tolerance = tolerance
+        self.baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, operation: str, board_size: int, samples: List[float]) -> Dict[str, Any]:
+        """Summarize one operation/board-size run, compare it with the baseline and attach it to Allure."""
+        key = f"{operation}[{board_size}]"
+        result = {"operation": operation, "board_size": board_size, **summarize(samples)}
+        comparison = self.compare(key, result)
+        if comparison is not None:
+            result["baseline"] = comparison
+        self.results[key] = result
+        log.info(f"{key}: p50={result['p50']:.1f} ms p95={result['p95']:.1f} ms p99={result['p99']:.1f} ms")
+        allure.attach(json.dumps(result, indent=2), name=f"benchmark_{key}",
+                      attachment_type=allure.attachment_type.JSON)
+        return result
+
+    def compare(self, key: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return p95 ratio against the baseline, flagging it as a regression above `tolerance`."""
+        baseline = self.baseline.get(key)
+        if baseline is None:
+            return None
+        ratio = result["p95"] / baseline["p95"] if baseline["p95"] else float("inf")
+        regressed = ratio > self.tolerance
+        if regressed:
+            log.warning(f"{key}: p95 {result['p95']:.1f} ms is {ratio:.2f}x the baseline {baseline['p95']:.1f} ms")
+        return {"p95": baseline["p95"], "p95_ratio": ratio, "regressed": regressed}
+
+    def save(self, update_baseline: bool = False):
+        """Write this worker's results, optionally merging them into the baseline."""
+        if not self.results:
+            return
+        BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        results_path = BENCHMARK_DIR / f"results-{worker}.json"
+        results_path.write_text(json.dumps(self.results, indent=2), encoding="utf-8")
+        log.info(f"Benchmark results written to {results_path}")
+        if update_baseline:
+            # Re-read so workers updating the baseline one after another keep each other's entries
+            current = json.loads(self.baseline_path.read_text(encoding="utf-8")) if self.baseline_path.exists() else {}
+            for key, result in self.results.items():
+                current[key] = {k: v for k, v in result.items() if k != "baseline"}
+            self.baseline_path.write_text(json.dumps(current, indent=2), encoding="utf-8")
@@ -0,0 +1,172 @@
+"""Long-lived Chromium that test sessions attach to instead of launching their own.
+
+    python -m utils.browser_server start     # once per working session
+    BROWSER_SERVER=true pytest tests/test_tasks.py -k add_task
+    python -m utils.browser_server stop
+
+Playwright for Python has no launch_server, so the server is a detached Chromium
+with a CDP port; sessions find it through BROWSER_WS_ENDPOINT or the lock file and
+attach with connect_over_cdp. Unhealthy or missing servers fall back to a local launch.
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import urlparse
+
+from playwright.sync_api import Browser, Playwright, sync_playwright
+
+log = logging.getLogger(__name__)
+
+LOCK_FILE = Path(__file__).resolve().parent.parent / ".browser-server.json"
+HEALTH_TIMEOUT = 0.5
+
+
+def server_enabled() -> bool:
+    return os.getenv("BROWSER_SERVER", "false").lower() == "true"
+
+
+def read_lock() -> Optional[dict]:
+    try:
+        return json.loads(LOCK_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def resolve_endpoint() -> Optional[str]:
+    """BROWSER_WS_ENDPOINT wins over the lock file written by `start`."""
+    endpoint = os.getenv("BROWSER_WS_ENDPOINT")
+    if endpoint:
+        return endpoint
+    lock = read_lock()
+    return lock["ws_endpoint"] if lock else None
+
+
+def _version_url(endpoint: str) -> str:
+    parsed = urlparse(endpoint)
+    return f"http://{parsed.netloc}/json/version"
+
+
+def is_healthy(endpoint: str) -> bool:
+    """True when the browser behind `endpoint` answers and is the one the endpoint names."""
+    try:
+        with urllib.request.urlopen(_version_url(endpoint), timeout=HEALTH_TIMEOUT) as response:
+            version = json.loads(response.read())
+    except (OSError, ValueError):
+        return False
+    # A restarted browser on the same port has a new browser id in its websocket URL
+    return version.get("webSocketDebuggerUrl") == endpoint or urlparse(endpoint).path in ("", "/")
+
+
+def connect(playwright: Playwright) -> Optional[Browser]:
+    """Attach to the running browser server, or return None so the caller launches locally."""
+    endpoint = resolve_endpoint()
+    if endpoint is None:
+        log.warning("BROWSER_SERVER is on but no server was found, launching a local browser")
+        return None
+    if not is_healthy(endpoint):
+        log.warning(f"Browser server at {endpoint} is not responding, launching a local browser")
+        return None
+    try:
+        browser = playwright.chromium.connect_over_cdp(endpoint)
+    except Exception as error:
+        log.warning(f"Could not connect to browser server at {endpoint} ({error}), launching a local browser")
+        return None
+    log.info(f"Connected to browser server at {endpoint}")
+    return browser
+
+
+def launch_args(headless: bool) -> List[str]:
+    """Chromium flags shared by local launches and the browser server."""
+    args = ["--disable-blink-features=AutomationControlled"]
+    if not headless:
+        args.append("--start-maximized")
+    return args
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start(headless: bool, args: List[str], timeout: float = 15) -> dict:
+    """Launch a detached Chromium with a CDP port and record it in the lock file."""
+    lock = read_lock()
+    if lock and is_healthy(lock["ws_endpoint"]):
+        return lock
+    with sync_playwright() as playwright:
+        executable = playwright.chromium.executable_path
+    port = _free_port()
+    command = [
+        executable,
+        f"--remote-debugging-port={port}",
+        "--remote-debugging-address=127.0.0.1",
+        f"--user-data-dir={tempfile.mkdtemp(prefix='browser-server-')}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        *args,
+    ]
+    if headless:
+        command.append("--headless=new")
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    version_url = f"http://127.0.0.1:{port}/json/version"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(version_url, timeout=HEALTH_TIMEOUT) as response:
+                endpoint = json.loads(response.read())["webSocketDebuggerUrl"]
+            break
+        except (OSError, ValueError, KeyError):
+            time.sleep(0.1)
+    else:
+        process.kill()
+        raise RuntimeError(f"Browser server did not come up on port {port} within {timeout} s")
+    lock = {"pid": process.pid, "ws_endpoint": endpoint}
+    LOCK_FILE.write_text(json.dumps(lock), encoding="utf-8")
+    return lock
+
+
+def stop():
+    lock = read_lock()
+    if lock is None:
+        return
+    # Only signal the pid while it still serves our endpoint; a stale lock's pid may have been reused
+    if not is_healthy(lock["ws_endpoint"]):
+        LOCK_FILE.unlink(missing_ok=True)
+        return
+    try:
+        os.kill(lock["pid"], signal.SIGTERM)
+    except OSError:
+        pass
+    LOCK_FILE.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the persistent browser server used with BROWSER_SERVER=true")
+    parser.add_argument("action", choices=("start", "stop", "status"))
+    args = parser.parse_args()
+
+    if args.action == "start":
+        headless = os.getenv("HEADLESS", "false").lower() == "true"
+        lock = start(headless, launch_args(headless))
+        print(f"Browser server running (pid {lock['pid']}) at {lock['ws_endpoint']}")
+    elif args.action == "stop":
+        stop()
+        print("Browser server stopped")
+    else:
+        endpoint = resolve_endpoint()
+        healthy = endpoint is not None and is_healthy(endpoint)
+        print(f"{endpoint or 'no endpoint'}: {'healthy' if healthy else 'not running'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import json
+import logging
+from typing import Any, Callable, Dict, List
+
+import allure
+from playwright.sync_api import Page
+
+from utils.benchmark import percentile
+
+log = logging.getLogger(__name__)
+
+FRAME_BUDGET_MS = 1000 / 60
+
+# Event Timing only reports discrete inputs at or above this duration
+EVENT_TIMING_THRESHOLD_MS = 16
+
+# Records requestAnimationFrame deltas, Long Animation Frames and input latencies between start() and stop()
+FRAME_SAMPLER_SCRIPT = """
+(durationThreshold) => {
+    if (window.__frameSampler) return;
+    const sampler = window.__frameSampler = { running: false, frames: [], longFrames: [], events: [], last: null };
+    const observe = (type, callback, options = {}) => {
+        try {
+            new PerformanceObserver((list) => sampler.running && list.getEntries().forEach(callback))
+                .observe({ type, ...options });
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    };
+    observe('long-animation-frame', (entry) => sampler.longFrames.push({
+        duration: entry.duration, blocking: entry.blockingDuration
+    }));
+    // Event Timing duration runs from the input's timestamp to the next paint after its handlers;
+    // the keydown/keyup or pointerdown/click entries of one interaction share an interactionId
+    observe('event', (entry) => entry.interactionId && sampler.events.push({
+        name: entry.name, interaction: entry.interactionId, duration: entry.duration
+    }), { durationThreshold });
+    // Event Timing does not report wheel input, so time each wheel burst to the next animation frame instead
+    let pendingWheel = null;
+    addEventListener('wheel', (event) => {
+        if (sampler.running && pendingWheel === null) pendingWheel = event.timeStamp;
+    }, { capture: true, passive: true });
+    const tick = (now) => {
+        if (!sampler.running) return;
+        if (pendingWheel !== null) {
+            sampler.events.push({ name: 'wheel', interaction: `wheel-${pendingWheel}`,
+                                  duration: performance.now() - pendingWheel });
+            pendingWheel = null;
+        }
+        if (sampler.last !== null) sampler.frames.push(now - sampler.last);
+        sampler.last = now;
+        requestAnimationFrame(tick);
+    };
+    sampler.start = () => {
+        Object.assign(sampler, { running: true, frames: [], longFrames: [], events: [], last: null });
+        requestAnimationFrame(tick);
+    };
+    // Let two more frames paint so the interaction's last update is included
+    sampler.stop = () => new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(() => {
+        sampler.running = false;
+        resolve({ frames: sampler.frames, longFrames: sampler.longFrames, events: sampler.events });
+    })));
+}
+"""
+
+
+def interaction_latencies(events: List[dict]) -> List[float]:
+    """Input-to-paint latency of each interaction, in order: the slowest of its events."""
+    latencies: Dict[Any, float] = {}
+    for event in events:
+        latencies[event["interaction"]] = max(latencies.get(event["interaction"], 0), event["duration"])
+    return list(latencies.values())
+
+
+def summarize_frames(recording: Dict[str, List]) -> Dict[str, Any]:
+    """Reduce a sampler recording to dropped frames, worst frame and per-interaction input-to-paint latency."""
+    frames = recording["frames"]
+    latencies = interaction_latencies(recording["events"])
+    return {
+        "frames": len(frames),
+        # A 50 ms frame means two 60 Hz frames were never painted
+        "dropped_frames": sum(max(0, round(delta / FRAME_BUDGET_MS) - 1) for delta in frames),
+        "worst_frame_ms": max(frames, default=0),
+        "p95_frame_ms": percentile(frames, 95) if frames else 0,
+        "long_animation_frames": len(recording["longFrames"]),
+        "blocking_ms": sum(frame["blocking"] for frame in recording["longFrames"]),
+        # Discrete inputs (keys, clicks) come from Event Timing, which leaves out interactions faster than
+        # EVENT_TIMING_THRESHOLD_MS; wheel input is timed to its next frame
+        "input_to_paint_ms": latencies,
+        "input_to_paint_p50_ms": percentile(latencies, 50) if latencies else None,
+        "input_to_paint_p95_ms": percentile(latencies, 95) if latencies else None,
+    }
+
+
+def describe_input_latency(summary: Dict[str, Any]) -> str:
+    latencies = summary["input_to_paint_ms"]
+    if not latencies:
+        return f"no input took {EVENT_TIMING_THRESHOLD_MS} ms or more to paint"
+    return (f"input-to-paint p50 {summary['input_to_paint_p50_ms']:.1f} ms, "
+            f"p95 {summary['input_to_paint_p95_ms']:.1f} ms over {len(latencies)} interactions")
+
+
+class FrameSampler:
+    """Measures what the user sees while a page interaction runs."""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    def measure(self, name: str, interaction: Callable[[], None]) -> Dict[str, Any]:
+        """Run `interaction` with frame sampling on and return its summary (frame deltas under "deltas")."""
+        self.page.evaluate(FRAME_SAMPLER_SCRIPT, EVENT_TIMING_THRESHOLD_MS)
+        self.page.evaluate("() => window.__frameSampler.start()")
+        interaction()
+        recording = self.page.evaluate("() => window.__frameSampler.stop()")
+        summary = summarize_frames(recording)
+        log.info(f"{name}: {summary['dropped_frames']} dropped frames, worst {summary['worst_frame_ms']:.1f} ms, "
+                 f"{describe_input_latency(summary)}")
+        allure.attach(json.dumps(summary, indent=2), name=f"frames_{name}",
+                      attachment_type=allure.attachment_type.JSON)
+        summary["deltas"] = recording["frames"]
+        return summary
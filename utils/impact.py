@@ -0,0 +1,469 @@
+"""Change-impact test selection.
+
+Builds a static map from every test to the page-object methods, locator
+attributes and module constants it reaches through BaseClass, intersects it
+with the lines changed since a git base, and runs only the affected tests.
+Anything the map cannot account for falls back to the full suite.
+
+    python -m utils.impact --base origin/main            # print the selection
+    python -m utils.impact --base origin/main --run -- -n auto
+"""
+import argparse
+import ast
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PAGE_DIRS = ("pages",)
+TEST_GLOB = "tests/**/test_*.py"
+BASE_CLASS_FILE = "tests/base_class.py"
+# Locator strings live in this file's SELECTORS dict and are looked up with selector("<name>")
+SELECTOR_REGISTRY_FILE = "pages/selector_registry.py"
+# Dependency on every registry entry, for tests that read the registry through a helper module
+ALL_SELECTORS = "selector:*"
+FIXTURE_NAME = "initialize"
+DURATIONS_PATH = PROJECT_ROOT / ".test-durations.json"
+# Documentation never affects test behaviour; every other file outside the map (requirements.txt,
+# conftest.py, pytest.ini, workflows, utils/) runs the full suite
+IGNORED = re.compile(r"(\.md|\.MD|LICENSE)$")
+
+Span = Tuple[int, int]
+
+
+@dataclass
+class ClassInfo:
+    name: str
+    file: str
+    span: Span
+    bases: List[str]
+    # member name -> line span; methods and `self.x = ...` attributes alike
+    members: Dict[str, Span] = field(default_factory=dict)
+    # method name -> unresolved references [(owner, attr)] where owner is "self" or a class name
+    refs: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+    # method name -> module constants it reads
+    constants: Dict[str, Set[str]] = field(default_factory=dict)
+    # method name -> class it returns, when it returns `SomeClass(...)`
+    returns: Dict[str, str] = field(default_factory=dict)
+
+
+def node_span(node: ast.AST) -> Span:
+    decorators = getattr(node, "decorator_list", [])
+    start = min([node.lineno] + [d.lineno for d in decorators])
+    return start, node.end_lineno
+
+
+def function_refs(func: ast.AST, class_names: Dict[str, str],
+                  attr_types: Dict[str, str]) -> Tuple[List[Tuple[str, str]], Set[str]]:
+    """Collect (owner, attr) references and bare names read inside a function body.
+
+    Locals bound to `SomeClass(...)`, `self.method()` or a typed attribute of a
+    known object (e.g. `todo = initialize.todo_page`) are followed one level.
+    """
+    local_types: Dict[str, str] = {}
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            owner = owner_of(node.value, class_names, attr_types, local_types)
+            if owner is not None:
+                local_types[node.targets[0].id] = owner
+    refs, names = [], set()
+    for node in ast.walk(func):
+        if isinstance(node, ast.Attribute):
+            owner = owner_of(node.value, class_names, attr_types, local_types)
+            if owner is not None:
+                refs.append((owner, node.attr))
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+    return refs, names
+
+
+def selector_names(node: ast.AST) -> Set[str]:
+    """Registry entries a statement or function looks up through `selector("<name>")`."""
+    return {call.args[0].value for call in ast.walk(node)
+            if isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "selector"
+            and call.args and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str)}
+
+
+def owner_of(value: ast.AST, class_names: Dict[str, str], attr_types: Dict[str, str],
+             local_types: Dict[str, str]) -> Optional[str]:
+    """Return the owner tag ("self", a qualified class name or "call:<method>") an expression evaluates to.
+
+    `class_names` maps the identifiers visible in the module to qualified class names.
+    """
+    if isinstance(value, ast.Name):
+        if value.id == "self":
+            return "self"
+        return local_types.get(value.id)
+    if isinstance(value, ast.Call):
+        func = value.func
+        if isinstance(func, ast.Name) and func.id in class_names:
+            return class_names[func.id]
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "self":
+            return f"call:{func.attr}"
+    if isinstance(value, ast.Attribute) and isinstance(value.value, ast.Name) and value.value.id == FIXTURE_NAME:
+        return attr_types.get(value.attr)
+    return None
+
+
+class DependencyMap:
+    """Static map of page-object classes and the symbols each test depends on."""
+
+    def __init__(self, root: Path = PROJECT_ROOT):
+        self.root = root
+        self.classes: Dict[str, ClassInfo] = {}
+        # file -> {constant name: span}; file -> {imported name: source file}
+        self.constants: Dict[str, Dict[str, Span]] = {}
+        self.imports: Dict[str, Dict[str, str]] = {}
+        # selector name -> span of its SELECTORS entry; selector name -> members that look it up
+        self.selector_spans: Dict[str, Span] = {}
+        self.selector_users: Dict[str, Set[str]] = {}
+        self.tests: Dict[str, Set[str]] = {}
+        self.test_spans: Dict[str, Dict[str, Span]] = {}
+        self.unmapped_tests: Set[str] = set()
+        self._parse_pages()
+        self.attr_types = self._parse_base_class()
+        self._resolve_returns()
+        self._parse_tests()
+
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    @staticmethod
+    def _module(file: str) -> str:
+        return file[:-3].replace("/", ".")
+
+    def _visible_classes(self, file: str, tree: ast.Module, known: Set[str]) -> Dict[str, str]:
+        """Identifiers in `file` that name a known page-object class, local or imported."""
+        visible = {n.name: f"{self._module(file)}.{n.name}" for n in tree.body if isinstance(n, ast.ClassDef)}
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and node.module:
+                for alias in node.names:
+                    qualified = f"{node.module}.{alias.name}"
+                    if qualified in known:
+                        visible[alias.asname or alias.name] = qualified
+        return visible
+
+    def _parse_pages(self):
+        files = [p for d in PAGE_DIRS for p in (self.root / d).rglob("*.py")]
+        trees = {self._rel(p): ast.parse(p.read_text(encoding="utf-8")) for p in files}
+        known = {f"{self._module(file)}.{n.name}" for file, tree in trees.items()
+                 for n in tree.body if isinstance(n, ast.ClassDef)}
+        for file, tree in trees.items():
+            class_names = self._visible_classes(file, tree, known)
+            self.constants[file], self.imports[file] = {}, {}
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    self._parse_class(file, node, class_names)
+                elif file == SELECTOR_REGISTRY_FILE and isinstance(node, (ast.Assign, ast.AnnAssign)) \
+                        and isinstance(node.value, ast.Dict):
+                    # Each registry entry is its own symbol, like a locator line in __init__
+                    for key, value in zip(node.value.keys, node.value.values):
+                        if isinstance(key, ast.Constant):
+                            self.selector_spans[key.value] = (key.lineno, value.end_lineno)
+                elif isinstance(node, ast.Assign) and all(isinstance(t, ast.Name) for t in node.targets):
+                    for target in node.targets:
+                        self.constants[file][target.id] = node_span(node)
+                elif isinstance(node, ast.ImportFrom) and node.module:
+                    for alias in node.names:
+                        self.imports[file][alias.asname or alias.name] = node.module.replace(".", "/") + ".py"
+
+    def _parse_class(self, file: str, node: ast.ClassDef, class_names: Dict[str, str]):
+        bases = [class_names[b.id] for b in node.bases if isinstance(b, ast.Name) and b.id in class_names]
+        info = ClassInfo(f"{self._module(file)}.{node.name}", file, node_span(node), bases)
+        for item in node.body:
+            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if item.name == "__init__":
+                # Each `self.x = ...` line in __init__ is its own symbol, so one locator edit stays narrow
+                for stmt in item.body:
+                    if isinstance(stmt, ast.Assign):
+                        for target in stmt.targets:
+                            if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name):
+                                info.members[target.attr] = node_span(stmt)
+                                self._add_selector_users(stmt, f"{info.name}.{target.attr}")
+                                # `self.x = self.dialog.locator(...)` depends on self.dialog
+                                info.refs[target.attr], info.constants[target.attr] = \
+                                    function_refs(stmt.value, class_names, {})
+                continue
+            info.members[item.name] = node_span(item)
+            self._add_selector_users(item, f"{info.name}.{item.name}")
+            info.refs[item.name], info.constants[item.name] = function_refs(item, class_names, {})
+            for stmt in ast.walk(item):
+                if isinstance(stmt, ast.Return) and isinstance(stmt.value, ast.Call) \
+                        and isinstance(stmt.value.func, ast.Name) and stmt.value.func.id in class_names:
+                    info.returns[item.name] = class_names[stmt.value.func.id]
+        self.classes[info.name] = info
+
+    def _add_selector_users(self, node: ast.AST, symbol: str):
+        for name in selector_names(node):
+            self.selector_users.setdefault(name, set()).add(symbol)
+
+    def _parse_base_class(self) -> Dict[str, str]:
+        """Map BaseClass attributes (todo_page, ...) to the page-object class they hold."""
+        tree = ast.parse((self.root / BASE_CLASS_FILE).read_text(encoding="utf-8"))
+        imported = self._visible_classes(BASE_CLASS_FILE, tree, set(self.classes))
+        attr_types = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef) and node.name == "BaseClass":
+                for stmt in ast.walk(node):
+                    if isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Call) \
+                            and isinstance(stmt.value.func, ast.Name):
+                        cls = imported.get(stmt.value.func.id)
+                        for target in stmt.targets:
+                            if cls and isinstance(target, ast.Attribute):
+                                attr_types[target.attr] = cls
+        return attr_types
+
+    def _resolve_returns(self):
+        # `form = self.open_add_task_screen()` is typed by what that method returns
+        for info in self.classes.values():
+            for method, refs in info.refs.items():
+                resolved = []
+                for owner, attr in refs:
+                    if owner.startswith("call:"):
+                        owner = self.lookup_return(info.name, owner[5:]) or "?"
+                    resolved.append((owner, attr))
+                info.refs[method] = resolved
+
+    def lookup_return(self, cls: str, method: str) -> Optional[str]:
+        for name in self.mro(cls):
+            if method in self.classes[name].returns:
+                return self.classes[name].returns[method]
+        return None
+
+    def mro(self, cls: str) -> List[str]:
+        order, queue = [], [cls]
+        while queue:
+            name = queue.pop(0)
+            if name in self.classes and name not in order:
+                order.append(name)
+                queue.extend(self.classes[name].bases)
+        return order
+
+    def resolve(self, cls: str, attr: str) -> Optional[str]:
+        """Return 'DefiningClass.attr' for an attribute looked up on `cls`."""
+        for name in self.mro(cls):
+            if attr in self.classes[name].members:
+                return f"{name}.{attr}"
+        return None
+
+    def closure(self, symbols: Set[str]) -> Set[str]:
+        """Everything reachable from `symbols` through method bodies."""
+        seen, stack = set(), list(symbols)
+        while stack:
+            symbol = stack.pop()
+            if symbol in seen:
+                continue
+            seen.add(symbol)
+            if symbol == ALL_SELECTORS:
+                continue
+            cls, member = symbol.rsplit(".", 1)
+            info = self.classes.get(cls)
+            if info is None:
+                continue
+            for owner, attr in info.refs.get(member, []):
+                target = self.resolve(cls if owner == "self" else owner, attr)
+                if target:
+                    stack.append(target)
+            for name in info.constants.get(member, ()):
+                # A constant is either defined in the method's own module or imported from another page module
+                source = info.file if name in self.constants[info.file] else self.imports[info.file].get(name)
+                if source in self.constants and name in self.constants[source]:
+                    seen.add(f"const:{source}:{name}")
+        return seen
+
+    def _reads_registry(self, module: str, seen: Optional[Set[str]] = None) -> bool:
+        """Whether project module `module` imports the selector registry, directly or transitively."""
+        file = module.replace(".", "/") + ".py"
+        if file == SELECTOR_REGISTRY_FILE:
+            return True
+        seen = set() if seen is None else seen
+        path = self.root / file
+        if file in seen or not path.exists():
+            return False
+        seen.add(file)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        imported = [n.module for n in ast.walk(tree) if isinstance(n, ast.ImportFrom) and n.module]
+        imported += [a.name for n in ast.walk(tree) if isinstance(n, ast.Import) for a in n.names]
+        return any(self._reads_registry(name, seen) for name in imported)
+
+    def _parse_tests(self):
+        for path in sorted(self.root.glob(TEST_GLOB)):
+            file = self._rel(path)
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+            registry_names = {alias.asname or alias.name for node in tree.body
+                              if isinstance(node, ast.ImportFrom) and node.module
+                              and self._reads_registry(node.module) for alias in node.names}
+            self.test_spans[file] = {}
+            for scope, node in self._test_functions(tree):
+                test_id = f"{file}::{scope}{node.name}"
+                self.test_spans[file][test_id] = node_span(node)
+            for test_id in self.test_spans[file]:
+                scope_nodes = self._scope_nodes(tree, test_id.split("::")[1:])
+                roots = set()
+                for func in scope_nodes:
+                    refs, names = function_refs(func, {}, self.attr_types)
+                    if names & registry_names:
+                        roots.add(ALL_SELECTORS)
+                    for owner, attr in refs:
+                        if owner in self.classes:
+                            target = self.resolve(owner, attr)
+                            if target:
+                                roots.add(target)
+                if not any(FIXTURE_NAME in {a.arg for a in f.args.args} for f in scope_nodes):
+                    self.unmapped_tests.add(test_id)
+                self.tests[test_id] = self.closure(roots)
+
+    @staticmethod
+    def _test_functions(tree: ast.Module):
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
+                yield "", node
+            elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef) and item.name.startswith("test_"):
+                        yield f"{node.name}::", item
+
+    @staticmethod
+    def _scope_nodes(tree: ast.Module, parts: List[str]) -> List[ast.FunctionDef]:
+        """The test function plus the non-test helpers/fixtures of its class (autouse setup included)."""
+        if len(parts) == 1:
+            return [n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == parts[0]]
+        cls = next(n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == parts[0])
+        return [n for n in cls.body if isinstance(n, ast.FunctionDef)
+                and (n.name == parts[1] or not n.name.startswith("test_"))]
+
+    def symbols_at(self, file: str, line: int) -> Optional[Set[str]]:
+        """Symbols a changed line in a page file belongs to; None when it cannot be attributed."""
+        if file == SELECTOR_REGISTRY_FILE:
+            # Only SELECTORS entries are attributable; SelectorEntry, selector() and the rest affect everything
+            for name, span in self.selector_spans.items():
+                if span[0] <= line <= span[1]:
+                    users = self.selector_users.get(name, set())
+                    readers = any(ALL_SELECTORS in deps for deps in self.tests.values())
+                    return users | {ALL_SELECTORS} if users or readers else None
+            return None
+        for name, span in self.constants.get(file, {}).items():
+            if span[0] <= line <= span[1]:
+                return {f"const:{file}:{name}"}
+        for info in self.classes.values():
+            if info.file != file or not info.span[0] <= line <= info.span[1]:
+                continue
+            hits = {f"{info.name}.{m}" for m, span in info.members.items() if span[0] <= line <= span[1]}
+            # A class-level line (decorator, docstring, signature) touches every member
+            return hits or {f"{info.name}.{m}" for m in info.members}
+        return None
+
+
+def changed_lines(base: str, root: Path = PROJECT_ROOT) -> Dict[str, Optional[Set[int]]]:
+    """Map each changed file to its changed new-file lines (None for deleted or renamed files)."""
+    output = subprocess.run(["git", "diff", "-U0", "--find-renames", base, "--"], cwd=root,
+                            capture_output=True, text=True, check=True).stdout
+    changes: Dict[str, Optional[Set[int]]] = {}
+    current = previous = None
+    for line in output.splitlines():
+        if line.startswith("+++ "):
+            current = None if line == "+++ /dev/null" else line[6:]
+            if current is None:
+                changes[previous] = None
+            else:
+                changes.setdefault(current, set())
+        elif line.startswith("--- "):
+            previous = line[6:] if line != "--- /dev/null" else None
+        elif line.startswith("rename from "):
+            changes[line[len("rename from "):]] = None
+        elif line.startswith("@@") and current is not None and changes[current] is not None:
+            match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", line)
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # Pure deletions have no new lines; mark the lines around the gap
+            changes[current].update(range(start, start + count) if count else (start, start + 1))
+    untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"], cwd=root,
+                               capture_output=True, text=True, check=True).stdout.split()
+    # New modules count as changed throughout; other untracked files are local artifacts (logs, reports)
+    for file in untracked:
+        if file.endswith(".py"):
+            changes[file] = set(range(1, 100000))
+    return changes
+
+
+def select_tests(dep_map: DependencyMap, changes: Dict[str, Optional[Set[int]]]) -> Tuple[Optional[Set[str]], str]:
+    """Return (selected test ids, reason); None means run the full suite."""
+    selected, touched = set(), set()
+    for file, lines in changes.items():
+        if IGNORED.search(file):
+            continue
+        if file in dep_map.test_spans:
+            if lines is None:
+                return None, f"{file} was deleted or renamed"
+            hits = {t for t, span in dep_map.test_spans[file].items() if any(span[0] <= l <= span[1] for l in lines)}
+            outside = [l for l in lines if not any(s[0] <= l <= s[1] for s in dep_map.test_spans[file].values())]
+            # Imports, decorators and helpers outside a test affect the whole file
+            selected |= set(dep_map.test_spans[file]) if outside else hits
+        elif file.startswith(tuple(f"{d}/" for d in PAGE_DIRS)) and file.endswith(".py"):
+            if lines is None:
+                return None, f"{file} was deleted or renamed"
+            for line in lines:
+                symbols = dep_map.symbols_at(file, line)
+                if symbols is None:
+                    return None, f"cannot attribute {file}:{line} to a page-object member"
+                touched |= symbols
+        else:
+            return None, f"{file} is outside the dependency map"
+    if touched:
+        selected |= {t for t, deps in dep_map.tests.items() if deps & touched}
+        # Tests the map could not follow (no `initialize` fixture) run whenever page objects change
+        selected |= dep_map.unmapped_tests
+    return selected, f"{len(touched)} page-object symbols changed"
+
+
+def estimate_saving(selected: Set[str], all_tests: Set[str]) -> Tuple[float, float]:
+    """Seconds of recorded duration for (all tests, skipped tests), using .test-durations.json."""
+    durations = json.loads(DURATIONS_PATH.read_text(encoding="utf-8")) if DURATIONS_PATH.exists() else {}
+    total = skipped = 0.0
+    for node_id, seconds in durations.items():
+        base_id = node_id.split("[", 1)[0]
+        if base_id in all_tests:
+            total += seconds
+            if base_id not in selected:
+                skipped += seconds
+    return total, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run only the tests affected by changes since a git base")
+    parser.add_argument("--base", default="origin/main", help="git revision to diff against")
+    parser.add_argument("--run", action="store_true", help="run pytest on the selection")
+    parser.add_argument("pytest_args", nargs="*", help="extra pytest arguments (after --)")
+    args = parser.parse_args()
+
+    dep_map = DependencyMap()
+    all_tests = set(dep_map.tests)
+    try:
+        selected, reason = select_tests(dep_map, changed_lines(args.base))
+    except (subprocess.CalledProcessError, SyntaxError) as error:
+        selected, reason = None, f"could not analyze changes ({error})"
+
+    if selected is None:
+        print(f"Running the full suite: {reason}")
+        targets = ["tests/"]
+    else:
+        total, skipped = estimate_saving(selected, all_tests)
+        print(f"Selected {len(selected)}/{len(all_tests)} tests ({reason}); "
+              f"saves ~{skipped:.0f}s of {total:.0f}s recorded")
+        for test_id in sorted(selected):
+            print(f"  {test_id}")
+        targets = sorted(selected)
+        if not targets:
+            return 0
+
+    if not args.run:
+        return 0
+    return subprocess.call([sys.executable, "-m", "pytest", *targets, *args.pytest_args], cwd=PROJECT_ROOT)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
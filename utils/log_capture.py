@@ -0,0 +1,53 @@
+import logging
+import os
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Tuple
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+class PerTestLogBuffer(logging.Handler):
+    """Keeps the formatted records of the running test in a bounded ring buffer."""
+
+    def __init__(self, capacity: int = 5000):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def start_test(self):
+        self.records.clear()
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(self.format(record))
+
+    def text(self) -> str:
+        return "\n".join(self.records)
+
+
+def configure_test_logging(log_dir: Path, level: int = logging.INFO) -> Tuple[PerTestLogBuffer, QueueListener]:
+    """Route root logging to a per-test buffer and, off the test thread, to a per-worker file.
+
+    Returns the buffer and the listener; stop the listener at session end to flush the file.
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    file_handler = logging.FileHandler(log_dir / f"test-{worker}.log", mode="w", encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+
+    buffer = PerTestLogBuffer()
+    buffer.setFormatter(formatter)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.addHandler(buffer)
+    root.setLevel(level)
+    return buffer, listener
@@ -0,0 +1,117 @@
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Tuple
+
+import allure
+from playwright.sync_api import CDPSession
+
+log = logging.getLogger(__name__)
+
+# Heap snapshot node types that hold retained JS memory (skips strings, code and hidden internals)
+SNAPSHOT_NODE_TYPES = {"object", "closure", "array", "native", "regexp"}
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    js_heap_used_bytes: float
+    dom_nodes: int
+    event_listeners: int
+    documents: int
+
+
+def slope(ys: List[float]) -> float:
+    """Least-squares growth per step of `ys` sampled at 0, 1, 2, ..."""
+    n = len(ys)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(ys) / n
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(ys))
+    variance = sum((x - mean_x) ** 2 for x in range(n))
+    return covariance / variance
+
+
+class MemorySampler:
+    """Samples retained JS heap and DOM counters after a forced GC, through the page's CDP session."""
+
+    def __init__(self, cdp: CDPSession):
+        self.cdp = cdp
+        self.samples: List[MemorySample] = []
+        self.cdp.send("HeapProfiler.enable")
+
+    def sample(self) -> MemorySample:
+        self.cdp.send("HeapProfiler.collectGarbage")
+        heap = self.cdp.send("Runtime.getHeapUsage")
+        counters = self.cdp.send("Memory.getDOMCounters")
+        sample = MemorySample(
+            js_heap_used_bytes=heap["usedSize"],
+            dom_nodes=counters["nodes"],
+            event_listeners=counters["jsEventListeners"],
+            documents=counters["documents"],
+        )
+        self.samples.append(sample)
+        return sample
+
+    def growth_per_cycle(self) -> Dict[str, float]:
+        """Slope of every counter across the samples taken so far."""
+        fields = MemorySample.__dataclass_fields__
+        return {field: slope([getattr(s, field) for s in self.samples]) for field in fields}
+
+    def heap_summary(self) -> Dict[str, Tuple[int, int]]:
+        """Take a heap snapshot (after GC) and return constructor name -> (count, self size)."""
+        chunks = []
+
+        def on_chunk(event: dict):
+            chunks.append(event["chunk"])
+
+        self.cdp.on("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+        try:
+            self.cdp.send("HeapProfiler.collectGarbage")
+            self.cdp.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+        finally:
+            self.cdp.remove_listener("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+        return summarize_snapshot(json.loads("".join(chunks)))
+
+    def attach(self, name: str = "memory_samples"):
+        allure.attach(
+            json.dumps({"samples": [asdict(s) for s in self.samples], "growth_per_cycle": self.growth_per_cycle()},
+                       indent=2),
+            name=name,
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+def summarize_snapshot(snapshot: dict) -> Dict[str, Tuple[int, int]]:
+    """Group a .heapsnapshot's nodes by constructor name into (count, self size)."""
+    meta = snapshot["snapshot"]["meta"]
+    fields = meta["node_fields"]
+    type_names = meta["node_types"][0]
+    type_at, name_at, size_at = fields.index("type"), fields.index("name"), fields.index("self_size")
+    nodes, strings, width = snapshot["nodes"], snapshot["strings"], len(fields)
+    summary = defaultdict(lambda: [0, 0])
+    for offset in range(0, len(nodes), width):
+        if type_names[nodes[offset + type_at]] not in SNAPSHOT_NODE_TYPES:
+            continue
+        entry = summary[strings[nodes[offset + name_at]]]
+        entry[0] += 1
+        entry[1] += nodes[offset + size_at]
+    return {name: (count, size) for name, (count, size) in summary.items()}
+
+
+def diff_summaries(before: Dict[str, Tuple[int, int]], after: Dict[str, Tuple[int, int]],
+                   limit: int = 40) -> List[dict]:
+    """Constructors whose retained size grew the most between two heap summaries."""
+    rows = []
+    for name in set(before) | set(after):
+        count_before, size_before = before.get(name, (0, 0))
+        count_after, size_after = after.get(name, (0, 0))
+        if size_after > size_before or count_after > count_before:
+            rows.append({
+                "constructor": name,
+                "count_delta": count_after - count_before,
+                "size_delta_bytes": size_after - size_before,
+                "count_after": count_after,
+            })
+    return sorted(rows, key=lambda row: row["size_delta_bytes"], reverse=True)[:limit]
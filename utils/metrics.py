@@ -0,0 +1,116 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import allure
+from playwright.sync_api import BrowserContext, Page
+
+from utils.throttling import budget_for
+
+log = logging.getLogger(__name__)
+
+METRICS_DIR = Path(__file__).resolve().parent.parent / "perf-metrics"
+
+# Installed before any page script runs so buffered LCP, layout-shift and long-task entries are kept
+OBSERVERS_SCRIPT = """
+(() => {
+    const store = window.__perfMetrics = { lcp: null, cls: 0, longTasks: 0, longTaskTime: 0 };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true });
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    };
+    observe('largest-contentful-paint', (entry) => { store.lcp = entry.startTime; });
+    observe('layout-shift', (entry) => { if (!entry.hadRecentInput) store.cls += entry.value; });
+    observe('longtask', (entry) => { store.longTasks += 1; store.longTaskTime += entry.duration; });
+})();
+"""
+
+# Navigation Timing Level 2 and paint entries plus whatever the observers gathered
+READ_METRICS_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = Object.fromEntries(performance.getEntriesByType('paint').map((e) => [e.name, e.startTime]));
+    const store = window.__perfMetrics || {};
+    return {
+        ttfb: nav ? nav.responseStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load_event_end: nav ? nav.loadEventEnd : null,
+        first_paint: paint['first-paint'] ?? null,
+        first_contentful_paint: paint['first-contentful-paint'] ?? null,
+        largest_contentful_paint: store.lcp ?? null,
+        cumulative_layout_shift: store.cls ?? null,
+        long_task_count: store.longTasks ?? null,
+        long_task_total_ms: store.longTaskTime ?? null,
+    };
+}
+"""
+
+
+class MetricsCollector:
+    """Gathers web performance metrics for one test's page through the DOM and CDP."""
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.transferred_bytes = 0
+        self.cdp = None
+
+    def start(self):
+        """Install the observers and CDP listeners; call before the first navigation."""
+        self.context.add_init_script(OBSERVERS_SCRIPT)
+        self.cdp = self.context.new_cdp_session(self.page)
+        self.cdp.send("Performance.enable")
+        self.cdp.send("Network.enable")
+        self.cdp.on("Network.loadingFinished", self._on_loading_finished)
+
+    def _on_loading_finished(self, event: dict):
+        self.transferred_bytes += int(event.get("encodedDataLength", 0))
+
+    def collect(self) -> Dict[str, Optional[float]]:
+        """Return a flat metric name -> value mapping for the current page."""
+        metrics = self.page.evaluate(READ_METRICS_SCRIPT)
+        cdp_metrics = {m["name"]: m["value"] for m in self.cdp.send("Performance.getMetrics")["metrics"]}
+        metrics["js_heap_used_bytes"] = cdp_metrics.get("JSHeapUsedSize")
+        metrics["js_heap_total_bytes"] = cdp_metrics.get("JSHeapTotalSize")
+        metrics["transferred_bytes"] = self.transferred_bytes
+        return metrics
+
+    def report(self, test_id: str, metrics: Dict[str, Optional[float]], profile: str = "desktop",
+               comparison_key: Optional[str] = None):
+        """Attach the metrics to Allure and append them to this worker's JSONL file."""
+        record = {"test": test_id, "timestamp": time.time(), "throttle_profile": profile,
+                  "comparison_key": comparison_key or test_id, "metrics": metrics}
+        allure.attach(
+            json.dumps(record, indent=2),
+            name="performance_metrics",
+            attachment_type=allure.attachment_type.JSON
+        )
+        METRICS_DIR.mkdir(parents=True, exist_ok=True)
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        with open(METRICS_DIR / f"metrics-{worker}.jsonl", "a", encoding="utf-8") as metrics_file:
+            metrics_file.write(json.dumps(record) + "\n")
+
+
+def check_budgets(metrics: Dict[str, Optional[float]], budgets: dict, profile: str = "desktop") -> List[str]:
+    """Return one message per metric that exceeds its budget (or was never measured).
+
+    A budget may be keyed per throttle profile; profiles it does not list are not checked.
+    """
+    violations = []
+    for name, limit in budgets.items():
+        limit = budget_for(limit, profile)
+        if limit is None:
+            continue
+        value = metrics.get(name)
+        if value is None:
+            violations.append(f"{name}: not measured (budget {limit})")
+        elif value > limit:
+            violations.append(f"{name}: {value:.2f} exceeds budget {limit}")
+    return violations
@@ -0,0 +1,100 @@
+import json
+import logging
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import allure
+from playwright.sync_api import BrowserContext, Request, Response, Route
+
+log = logging.getLogger(__name__)
+
+SERVICE_WORKER_MODES = ("allow", "block")
+
+
+@dataclass
+class NetworkProfile:
+    """Which page requests to abort; an allowed pattern always wins over a block rule."""
+    blocked_resource_types: List[str] = field(default_factory=list)
+    blocked_url_patterns: List[str] = field(default_factory=list)
+    allowed_url_patterns: List[str] = field(default_factory=list)
+
+    def blocks(self, request: Request) -> bool:
+        url = request.url
+        if any(re.search(pattern, url) for pattern in self.allowed_url_patterns):
+            return False
+        return (request.resource_type in self.blocked_resource_types
+                or any(re.search(pattern, url) for pattern in self.blocked_url_patterns))
+
+
+PROFILES: Dict[str, NetworkProfile] = {
+    # Everything the app asks for, as a real user would get it
+    "full": NetworkProfile(),
+    # CRUD tests only need the document, scripts, styles and data
+    "functional": NetworkProfile(
+        blocked_resource_types=["image", "font", "media"],
+        blocked_url_patterns=[r"google-analytics\.com", r"googletagmanager\.com", r"fonts\.googleapis\.com"],
+    ),
+}
+
+
+def network_profile() -> NetworkProfile:
+    """Return the profile named by NETWORK_PROFILE (defaults to functional)."""
+    name = os.getenv("NETWORK_PROFILE", "functional").lower()
+    if name not in PROFILES:
+        raise ValueError(f"NETWORK_PROFILE must be one of {tuple(PROFILES)}, got '{name}'")
+    return PROFILES[name]
+
+
+def service_worker_mode(node=None) -> str:
+    """Block the PWA service worker (and its offline bootstrap) unless the test or SERVICE_WORKERS asks for it."""
+    mode = os.getenv("SERVICE_WORKERS", "block").lower()
+    if mode not in SERVICE_WORKER_MODES:
+        raise ValueError(f"SERVICE_WORKERS must be one of {SERVICE_WORKER_MODES}, got '{mode}'")
+    if node is not None and node.get_closest_marker("service_worker"):
+        return "allow"
+    return mode
+
+
+class NetworkRouter:
+    """Applies a NetworkProfile to a context and counts what it blocked and let through."""
+
+    def __init__(self, context: BrowserContext, profile: NetworkProfile):
+        self.context = context
+        self.profile = profile
+        self.blocked = Counter()
+        self.allowed = Counter()
+
+    def start(self):
+        if self.profile.blocked_resource_types or self.profile.blocked_url_patterns:
+            self.context.route("**/*", self._handle)
+        self.context.on("response", self._on_response)
+
+    def _handle(self, route: Route):
+        request = route.request
+        # Service-worker requests (the offline precache) pass through so the SW install never breaks
+        if request.service_worker is None and self.profile.blocks(request):
+            self.blocked[request.resource_type] += 1
+            route.abort("blockedbyclient")
+        else:
+            # fallback() keeps earlier routes, such as the HAR replay, in the chain
+            route.fallback()
+
+    def _on_response(self, response: Response):
+        self.allowed[response.request.resource_type] += 1
+
+    def report(self, transferred_bytes: int) -> dict:
+        """Log the request counts, with the bytes MetricsCollector saw on the wire, and attach them to Allure."""
+        stats = {
+            "blocked": dict(self.blocked),
+            "blocked_total": sum(self.blocked.values()),
+            "allowed": dict(self.allowed),
+            "allowed_total": sum(self.allowed.values()),
+            "allowed_bytes": transferred_bytes,
+        }
+        log.info(f"Network: blocked {stats['blocked_total']} requests, allowed {stats['allowed_total']} "
+                 f"({stats['allowed_bytes']} bytes)")
+        allure.attach(json.dumps(stats, indent=2), name="network_profile", attachment_type=allure.attachment_type.JSON)
+        return stats
@@ -0,0 +1,182 @@
+"""Hot-path profiler for page objects.
+
+With PROFILE_PAGES=true in the environment, every public method of BasePage and
+its subclasses is wrapped at class creation. Each call records its count, wall
+time, self time, and how much of it went to waiting or acting. Playwright's own
+Locator, Page, Keyboard, Mouse and expect() methods are wrapped too, so a wait
+or action a page method makes directly (locator.click(), expect(...).to_*)
+is attributed as such instead of vanishing into the method's self time.
+Per-worker profiles are written to profiles/ at session end. This module's CLI aggregates them across tests and runs:
+
+    python -m utils.profiler --sort wait_ms
+    python -m utils.profiler --flamegraph profile.folded   # for flamegraph.pl / speedscope
+"""
+import argparse
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict
+
+from playwright.sync_api import Keyboard, Locator, LocatorAssertions, Mouse, Page, PageAssertions
+
+PROFILES_DIR = Path(__file__).resolve().parent.parent / "profiles"
+ACT_METHODS = {"click", "fill", "get_text"}
+# Playwright calls that drive or read the page; waits are wait_for* and expect()'s to_*/not_to_* assertions
+PLAYWRIGHT_CLASSES = (Locator, Page, Keyboard, Mouse, LocatorAssertions, PageAssertions)
+PLAYWRIGHT_ACT_METHODS = {
+    "check", "clear", "click", "dblclick", "down", "drag_to", "fill", "focus", "goto", "hover", "inner_text",
+    "input_value", "insert_text", "move", "press", "press_sequentially", "reload", "select_option",
+    "set_input_files", "tap", "text_content", "type", "uncheck", "up", "wheel",
+}
+STAT_FIELDS = ("calls", "total_ms", "self_ms", "wait_ms", "act_ms")
+
+
+def category(method_name: str) -> str:
+    if method_name.startswith("wait_for"):
+        return "wait"
+    if method_name in ACT_METHODS:
+        return "act"
+    return "flow"
+
+
+def playwright_category(method_name: str) -> str:
+    if method_name.startswith(("wait_for", "to_", "not_to_")):
+        return "wait"
+    if method_name in PLAYWRIGHT_ACT_METHODS:
+        return "act"
+    return "flow"
+
+
+class _Frame:
+    __slots__ = ("name", "category", "child_ms", "child_wait_ms", "child_act_ms")
+
+    def __init__(self, name: str, category: str):
+        self.name = name
+        self.category = category
+        self.child_ms = 0.0
+        self.child_wait_ms = 0.0
+        self.child_act_ms = 0.0
+
+
+class Profiler:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.stats: Dict[str, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(STAT_FIELDS, 0))
+        # Collapsed call stacks ("test;TodoPage.add_task;BasePage.click") -> self time in ms
+        self.stacks: Dict[str, float] = defaultdict(float)
+        self.root = "session"
+        self._local = threading.local()
+
+    def begin_test(self, test_id: str):
+        self.root = test_id.replace(";", "_")
+
+    def call(self, name: str, kind: str, func: Callable, *args, **kwargs):
+        stack = self._local.__dict__.setdefault("stack", [])
+        frame = _Frame(name, kind)
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            path = ";".join([self.root] + [f.name for f in stack])
+            stack.pop()
+            self_ms = elapsed_ms - frame.child_ms
+            wait_ms = frame.child_wait_ms + (self_ms if kind == "wait" else 0.0)
+            act_ms = frame.child_act_ms + (self_ms if kind == "act" else 0.0)
+            stats = self.stats[name]
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["self_ms"] += self_ms
+            stats["wait_ms"] += wait_ms
+            stats["act_ms"] += act_ms
+            self.stacks[path] += self_ms
+            if stack:
+                parent = stack[-1]
+                parent.child_ms += elapsed_ms
+                parent.child_wait_ms += wait_ms
+                parent.child_act_ms += act_ms
+
+    def save(self):
+        """Write this process's profile to profiles/profile-<worker>-<timestamp>.json."""
+        if not self.stats:
+            return
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        path = PROFILES_DIR / f"profile-{worker}-{int(time.time())}.json"
+        path.write_text(json.dumps({"stats": self.stats, "stacks": self.stacks}), encoding="utf-8")
+
+
+PROFILER = Profiler(enabled=os.getenv("PROFILE_PAGES", "false").lower() == "true")
+
+
+def instrument(cls: type) -> type:
+    """Wrap the public methods `cls` defines so each call is recorded by PROFILER."""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value) or getattr(value, "__profiled__", False):
+            continue
+        setattr(cls, attr, _profiled(f"{cls.__name__}.{attr}", category(attr), value))
+    return cls
+
+
+def instrument_playwright():
+    """Wrap Playwright's sync waits and actions so calls made outside BasePage helpers are attributed."""
+    for cls in PLAYWRIGHT_CLASSES:
+        for attr, value in list(vars(cls).items()):
+            if not inspect.isfunction(value) or getattr(value, "__profiled__", False):
+                continue
+            kind = playwright_category(attr)
+            if kind != "flow":
+                setattr(cls, attr, _profiled(f"{cls.__name__}.{attr}", kind, value))
+
+
+def _profiled(name: str, kind: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return PROFILER.call(name, kind, func, *args, **kwargs)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def load_profiles(directory: Path = PROFILES_DIR):
+    """Sum every saved profile into (stats, stacks)."""
+    stats: Dict[str, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(STAT_FIELDS, 0))
+    stacks: Dict[str, float] = defaultdict(float)
+    for path in sorted(directory.glob("profile-*.json")):
+        profile = json.loads(path.read_text(encoding="utf-8"))
+        for name, values in profile["stats"].items():
+            for key in STAT_FIELDS:
+                stats[name][key] += values[key]
+        for stack, ms in profile["stacks"].items():
+            stacks[stack] += ms
+    return stats, stacks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate page-object profiles across tests and runs")
+    parser.add_argument("--sort", default="total_ms", choices=STAT_FIELDS, help="column to sort by")
+    parser.add_argument("--limit", type=int, default=30, help="rows to show")
+    parser.add_argument("--flamegraph", type=Path, help="write collapsed stacks (microseconds) to this file")
+    args = parser.parse_args()
+
+    stats, stacks = load_profiles()
+    rows = sorted(stats.items(), key=lambda item: item[1][args.sort], reverse=True)[:args.limit]
+    print(f"{'method':45} {'calls':>7} {'total_ms':>11} {'self_ms':>10} {'wait_ms':>10} {'act_ms':>10}")
+    for name, values in rows:
+        print(f"{name:45} {values['calls']:>7} {values['total_ms']:>11.0f} {values['self_ms']:>10.0f} "
+              f"{values['wait_ms']:>10.0f} {values['act_ms']:>10.0f}")
+    if args.flamegraph:
+        with open(args.flamegraph, "w", encoding="utf-8") as folded:
+            for stack, ms in sorted(stacks.items()):
+                folded.write(f"{stack} {int(ms * 1000)}\n")
+        print(f"Collapsed stacks written to {args.flamegraph}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Offline replay of the app from a HAR archive.
+
+    python -m utils.replay record        # capture every route and dialog once
+    REPLAY_MODE=replay pytest tests/     # serve the suite from the archive
+
+Recording runs in a single context with the full network profile, so one
+writer produces the archive and nothing the tests need is blocked from it.
+"""
+import argparse
+import functools
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.sync_api import BrowserContext, Route, sync_playwright
+
+from pages.todo_page import TodoPage
+from utils import browser_server
+from utils.throttling import ThrottleProfile
+
+log = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+REPLAY_MODES = ("off", "replay")
+RECORDED_TASK = "Recorded task"
+
+
+def replay_mode() -> str:
+    """Return REPLAY_MODE from the environment: off (live site) or replay."""
+    mode = os.getenv("REPLAY_MODE", "off").lower()
+    if mode not in REPLAY_MODES:
+        raise ValueError(f"REPLAY_MODE must be one of {REPLAY_MODES}, got '{mode}' "
+                         f"(capture the archive with `python -m utils.replay record`)")
+    return mode
+
+
+def har_path() -> Path:
+    """Return the HAR archive location, relative paths resolved from the project root."""
+    path = Path(os.getenv("REPLAY_HAR", "recordings/app.har"))
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def replay_route_options() -> Optional[Dict[str, Any]]:
+    """Return route_from_har keyword arguments for REPLAY_MODE, or None when it is off."""
+    if replay_mode() == "off":
+        return None
+
+    path = har_path()
+    if not path.exists():
+        raise FileNotFoundError(f"No HAR archive at {path}, run once with REPLAY_MODE=record to capture it")
+    # Anything missing from the archive is aborted so the suite never touches the network
+    log.info(f"Replaying app assets from {path}")
+    return {"har": path, "not_found": "abort"}
+
+
+def attach_replay(context: BrowserContext) -> str:
+    """Route the context through the HAR archive according to REPLAY_MODE."""
+    options = replay_route_options()
+    if options is not None:
+        context.route_from_har(**options)
+    return replay_mode()
+
+
+@functools.lru_cache(maxsize=None)
+def archived_sizes(path: Path) -> Dict[str, int]:
+    """Response size (headers and body) of every archived URL."""
+    sizes = {}
+    for entry in json.loads(path.read_text(encoding="utf-8"))["log"]["entries"]:
+        response = entry["response"]
+        body = response.get("bodySize", -1)
+        if body is None or body < 0:
+            body = response.get("content", {}).get("size", 0)
+        sizes[entry["request"]["url"]] = max(body, 0) + max(response.get("headersSize", 0) or 0, 0)
+    return sizes
+
+
+def throttle_replay(context: BrowserContext, profile: ThrottleProfile):
+    """Hold each replayed response for the latency and transfer time `profile` would add.
+
+    Replayed responses are fulfilled from the archive outside Chromium's
+    network stack, where Network.emulateNetworkConditions never applies.
+    Register after attach_replay and before other routes, so only requests
+    that will be served from the archive are delayed.
+    """
+    if replay_mode() != "replay" or not profile.network_throttled:
+        return
+    sizes = archived_sizes(har_path())
+
+    def delay(route: Route):
+        request = route.request
+        delay_ms = profile.transfer_ms(sizes.get(request.url, 0), len(request.post_data_buffer or b""))
+        # Service-worker requests have no frame to wait on; they pass undelayed
+        if request.service_worker is None:
+            # Yields to the driver, so other requests keep loading while this one waits
+            request.frame.wait_for_timeout(delay_ms)
+        route.fallback()
+
+    context.route("**/*", delay)
+    log.info(f"Replaying with '{profile.name}' latency and throughput")
+
+
+async def attach_replay_async(context: AsyncBrowserContext) -> str:
+    """asyncio counterpart of attach_replay."""
+    options = replay_route_options()
+    if options is not None:
+        await context.route_from_har(**options)
+    return replay_mode()
+
+
+def record(base_url: str, headless: bool) -> Path:
+    """Walk every route and dialog the suite uses in one context and write what it fetched to the archive."""
+    path = har_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless, args=browser_server.launch_args(headless))
+        # Service workers on so the offline precache, which service_worker tests replay, is captured too
+        context = browser.new_context(locale="en-US", service_workers="allow")
+        context.route_from_har(path, update=True, update_content="embed", update_mode="minimal")
+        page = context.new_page()
+        todo = TodoPage(page)
+        page.goto(base_url)
+        todo.wait_for_element_not_to_be_visible()
+        todo.add_task(RECORDED_TASK)
+        todo.edit_task(0, f"{RECORDED_TASK} (edited)")
+        todo.mark_complete(0)
+        todo.delete_task(0)
+        todo.wait_for()
+        # The archive is written when its context closes
+        context.close()
+        browser.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capture the app into the HAR archive used by REPLAY_MODE=replay")
+    parser.add_argument("action", choices=("record",))
+    parser.parse_args()
+
+    load_dotenv(PROJECT_ROOT / "utils" / ".env")
+    headless = os.getenv("HEADLESS", "false").lower() == "true"
+    path = record(os.getenv("BASE_URL"), headless)
+    print(f"Recorded {os.getenv('BASE_URL')} into {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import allure
+from playwright.sync_api import Locator, Page
+
+from pages.selector_registry import INDEX_PATH, SELECTORS, load_index, selector
+from utils.benchmark import BENCHMARK_DIR, percentile
+
+log = logging.getLogger(__name__)
+
+REPEATS = 5
+# Flag a strategy whose resolution time on the largest board is this many times the smallest board's
+SCALING_LIMIT = 3.0
+# Resolution times below this are noise; keeps ratios of near-zero timings meaningful
+MIN_RESOLUTION_MS = 0.05
+
+
+def strategy_locator(page: Page, name: str, strategy: str) -> Locator:
+    """A locator for one strategy of a registry entry, scoped the way its page object scopes it."""
+    within = SELECTORS[name].within
+    root = page if within is None else page.locator(selector(within))
+    return root.locator(strategy)
+
+
+def time_resolution(locator: Locator, repeats: int = REPEATS) -> Tuple[float, int]:
+    """Median ms to resolve `locator` (one count() round trip) and how many elements it matched."""
+    timings = []
+    count = 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        count = locator.count()
+        timings.append((time.perf_counter() - started) * 1000)
+    return percentile(timings, 50), count
+
+
+class SelectorCostReport:
+    """Resolution time of every registry strategy per board size, and which stable strategies are proven."""
+
+    def __init__(self):
+        # name -> strategy -> board size -> {"ms": ..., "count": ...}
+        self.results: Dict[str, Dict[str, Dict[int, dict]]] = {}
+
+    def measure_state(self, page: Page, state: str, board_size: int):
+        """Time every strategy of the entries that live in `state`, net of the protocol round trip."""
+        round_trip, _ = time_resolution(page.locator("html"))
+        for name, entry in SELECTORS.items():
+            if entry.state != state:
+                continue
+            for strategy in entry.strategies:
+                ms, count = time_resolution(strategy_locator(page, name, strategy))
+                self.results.setdefault(name, {}).setdefault(strategy, {})[board_size] = {
+                    "ms": max(ms - round_trip, MIN_RESOLUTION_MS),
+                    "count": count,
+                }
+
+    def matched(self, name: str) -> bool:
+        """Whether the original selector found anything; timings of selectors that match nothing mean nothing."""
+        runs = self.results.get(name, {}).get(SELECTORS[name].original, {})
+        return any(run["count"] for run in runs.values())
+
+    def scaling(self, name: str, strategy: str) -> float:
+        runs = self.results[name][strategy]
+        return runs[max(runs)]["ms"] / runs[min(runs)]["ms"]
+
+    def flagged(self) -> List[Tuple[str, str, float]]:
+        return [(name, strategy, self.scaling(name, strategy))
+                for name, strategies in self.results.items() if self.matched(name) for strategy in strategies
+                if len(strategies[strategy]) > 1 and self.scaling(name, strategy) > SCALING_LIMIT]
+
+    def verified_strategy(self, name: str) -> Optional[str]:
+        """First stable strategy that matched as many elements as the original on every board (and some)."""
+        if not self.matched(name):
+            return None
+        runs = self.results[name]
+        expected = {size: run["count"] for size, run in runs[SELECTORS[name].original].items()}
+        for strategy in SELECTORS[name].strategies[:-1]:
+            counts = {size: run["count"] for size, run in runs.get(strategy, {}).items()}
+            if counts == expected:
+                return strategy
+        return None
+
+    def choice(self, name: str) -> Optional[str]:
+        """Strategy the page objects should use: the first verified stable one, else the original.
+
+        None when the original matched nothing, since then this run proved nothing either way.
+        """
+        if not self.matched(name):
+            return None
+        return self.verified_strategy(name) or SELECTORS[name].original
+
+    def save(self, update_index: bool = False):
+        """Write this worker's results and, when asked, point the registry at the verified strategies."""
+        flagged = self.flagged()
+        for name, strategy, ratio in flagged:
+            log.warning(f"{name}: '{strategy}' resolves {ratio:.1f}x slower on the largest board than the smallest")
+        for name in self.results:
+            if not self.matched(name):
+                log.warning(f"{name}: the original selector matched nothing in state '{SELECTORS[name].state}', "
+                            f"its timings are left out of the comparison")
+        report = {
+            name: {
+                "strategies": {strategy: {str(size): run for size, run in runs.items()}
+                               for strategy, runs in strategies.items()},
+                "matched": self.matched(name),
+                "verified": self.verified_strategy(name),
+            }
+            for name, strategies in self.results.items()
+        }
+        report["_flagged"] = [{"selector": name, "strategy": strategy, "scaling": ratio}
+                              for name, strategy, ratio in flagged]
+        allure.attach(json.dumps(report, indent=2), name="selector_cost", attachment_type=allure.attachment_type.JSON)
+        BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        (BENCHMARK_DIR / f"selectors-{worker}.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+        if update_index:
+            index = load_index()
+            for name in self.results:
+                choice = self.choice(name)
+                if choice is None:
+                    continue
+                if choice == SELECTORS[name].preferred:
+                    index.pop(name, None)
+                else:
+                    index[name] = choice
+            INDEX_PATH.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            log.info(f"Selector index updated, {len(index)} entries pinned away from their preferred strategy")
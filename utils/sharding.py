@@ -0,0 +1,111 @@
+import argparse
+import json
+import logging
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+log = logging.getLogger(__name__)
+
+DURATIONS_PATH = Path(__file__).resolve().parent.parent / ".test-durations.json"
+# Assumed duration for tests with no history yet
+DEFAULT_DURATION = 1.0
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse '--shard i/N' (1-based) into (i, N)."""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects i/N, got '{value}'")
+    if not 1 <= index <= total:
+        raise pytest.UsageError(f"--shard index must be between 1 and {total}, got {index}")
+    return index, total
+
+
+def load_durations(path: Path = DURATIONS_PATH) -> Dict[str, float]:
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def merge_durations(base: Dict[str, float], shard_histories: List[Dict[str, float]]) -> Dict[str, float]:
+    """Fold each shard's history into `base`, taking only the durations that shard re-measured."""
+    merged = dict(base)
+    for history in shard_histories:
+        merged.update({node_id: duration for node_id, duration in history.items() if base.get(node_id) != duration})
+    return merged
+
+
+def partition(node_ids: List[str], durations: Dict[str, float], shards: int) -> List[List[str]]:
+    """Greedy longest-first split of tests into `shards` buckets of similar total duration."""
+    fallback = median(durations.values()) if durations else DEFAULT_DURATION
+    buckets = [[] for _ in range(shards)]
+    totals = [0.0] * shards
+    for node_id in sorted(node_ids, key=lambda n: durations.get(n, fallback), reverse=True):
+        lightest = totals.index(min(totals))
+        buckets[lightest].append(node_id)
+        totals[lightest] += durations.get(node_id, fallback)
+    return buckets
+
+
+class DurationScheduler:
+    """Orders tests longest-first from recorded durations and optionally keeps one shard.
+
+    With `-n N --dist load`, xdist hands the longest tests out first, so workers
+    finish close together. Durations of this run are merged back into the
+    history by the controlling process at session end.
+    """
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.history = load_durations()
+        self.shard = parse_shard(config.getoption("--shard")) if config.getoption("--shard") else None
+        self.measured: Dict[str, float] = {}
+        self.skipped: Set[str] = set()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        fallback = median(self.history.values()) if self.history else DEFAULT_DURATION
+        # Sorting is stable and deterministic, so every xdist worker ends up with the same order
+        items.sort(key=lambda item: self.history.get(item.nodeid, fallback), reverse=True)
+        if self.shard is None:
+            return
+        index, total = self.shard
+        keep = set(partition([item.nodeid for item in items], self.history, total)[index - 1])
+        deselected = [item for item in items if item.nodeid not in keep]
+        items[:] = [item for item in items if item.nodeid in keep]
+        config.hook.pytest_deselected(items=deselected)
+        log.info(f"Shard {index}/{total}: running {len(items)} tests, deselected {len(deselected)}")
+
+    def pytest_runtest_logreport(self, report):
+        # A skip (e.g. a benchmark without --benchmark) says nothing about how long the test takes
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+            return
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        # xdist workers report to the controller, which owns the history file
+        measured = {node_id: duration for node_id, duration in self.measured.items() if node_id not in self.skipped}
+        if hasattr(self.config, "workerinput") or not measured:
+            return
+        history = load_durations()
+        history.update({node_id: round(duration, 3) for node_id, duration in measured.items()})
+        DURATIONS_PATH.write_text(json.dumps(history, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge the duration histories written by CI shards")
+    parser.add_argument("shards", nargs="+", type=Path, help="each shard's .test-durations.json")
+    parser.add_argument("--base", type=Path, default=DURATIONS_PATH, help="history every shard started from")
+    parser.add_argument("-o", "--output", type=Path, default=DURATIONS_PATH)
+    args = parser.parse_args()
+
+    merged = merge_durations(load_durations(args.base), [load_durations(path) for path in args.shards])
+    args.output.write_text(json.dumps(merged, indent=2, sort_keys=True), encoding="utf-8")
+    print(f"Merged {len(args.shards)} shard histories into {args.output} ({len(merged)} tests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Union
+
+import allure
+from playwright.sync_api import Page, Locator, expect
+
+log = logging.getLogger(__name__)
+
+# The app persists its whole state (tasks included) as JSON under this localStorage key
+STORAGE_KEY = "user"
+DEFAULT_COLOR = "#b624ff"
+
+# Merges the seeded tasks into the stored user object and returns the resulting task count
+SEED_TASKS_SCRIPT = """
+([storageKey, tasks, append]) => {
+    const user = JSON.parse(localStorage.getItem(storageKey) || '{}');
+    const existing = append && Array.isArray(user.tasks) ? user.tasks : [];
+    user.tasks = existing.concat(tasks);
+    localStorage.setItem(storageKey, JSON.stringify(user));
+    return user.tasks.length;
+}
+"""
+
+
+@dataclass
+class SeedTask:
+    name: str
+    description: str = ""
+    deadline: Optional[datetime] = None
+    category: Optional[str] = None
+    color: str = DEFAULT_COLOR
+    done: bool = False
+
+    def to_storage(self, created: datetime) -> dict:
+        """Serialize into the shape the app keeps in localStorage."""
+        task = {
+            "id": str(uuid.uuid4()),
+            "done": self.done,
+            "pinned": False,
+            "name": self.name,
+            "description": self.description,
+            "color": self.color,
+            "date": created.isoformat(),
+        }
+        if self.deadline is not None:
+            task["deadline"] = self.deadline.isoformat()
+        if self.category is not None:
+            task["category"] = [{"id": str(uuid.uuid4()), "name": self.category, "color": self.color}]
+        return task
+
+
+class TaskSeeder:
+    """Writes tasks straight into the app's localStorage instead of going through /add."""
+
+    def __init__(self, page: Page, task_items: Locator):
+        self.page = page
+        self.task_items = task_items
+
+    @allure.step("Seed tasks into client-side storage")
+    def seed(self, tasks: Iterable[Union[SeedTask, str]], append: bool = False, timeout: int = 10000) -> int:
+        """Store `tasks` (names or SeedTask objects), reload and wait for them to render."""
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        # Creation dates one millisecond apart keep the order the tasks were given in
+        payload = [
+            (task if isinstance(task, SeedTask) else SeedTask(name=task)).to_storage(now + timedelta(milliseconds=i))
+            for i, task in enumerate(tasks)
+        ]
+        total = self.page.evaluate(SEED_TASKS_SCRIPT, [STORAGE_KEY, payload, append])
+        self.page.reload()
+        expect(self.task_items).to_have_count(total, timeout=timeout)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        log.info(f"Seeded {len(payload)} tasks ({total} on board) in {elapsed_ms:.0f} ms")
+        return total
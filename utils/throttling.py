@@ -0,0 +1,118 @@
+import argparse
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from playwright.sync_api import CDPSession
+
+log = logging.getLogger(__name__)
+
+# Where MetricsCollector appends its per-worker metrics-<worker>.jsonl records
+COMPARISON_DIR = Path(__file__).resolve().parent.parent / "perf-metrics"
+
+
+@dataclass(frozen=True)
+class ThrottleProfile:
+    name: str
+    cpu_rate: float = 1
+    latency_ms: float = 0
+    # Bytes per second, -1 disables throughput throttling
+    download_bps: float = -1
+    upload_bps: float = -1
+
+    @property
+    def network_throttled(self) -> bool:
+        return self.latency_ms > 0 or self.download_bps >= 0 or self.upload_bps >= 0
+
+    @property
+    def throttled(self) -> bool:
+        return self.cpu_rate != 1 or self.network_throttled
+
+    def transfer_ms(self, download_bytes: int, upload_bytes: int = 0) -> float:
+        """Latency plus time on the wire for one request under this profile (throughput is not shared)."""
+        ms = self.latency_ms
+        if self.download_bps > 0:
+            ms += download_bytes / self.download_bps * 1000
+        if self.upload_bps > 0:
+            ms += upload_bytes / self.upload_bps * 1000
+        return ms
+
+    def apply(self, cdp: CDPSession):
+        """Emulate this profile on the page behind `cdp` (Network must already be enabled)."""
+        if not self.throttled:
+            return
+        cdp.send("Emulation.setCPUThrottlingRate", {"rate": self.cpu_rate})
+        cdp.send("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": self.latency_ms,
+            "downloadThroughput": self.download_bps,
+            "uploadThroughput": self.upload_bps,
+        })
+        log.info(f"Throttling as '{self.name}': {self.cpu_rate}x CPU, {self.latency_ms} ms latency")
+
+
+# Network figures are the Chrome DevTools Fast 3G / Slow 3G presets
+THROTTLE_PROFILES: Dict[str, ThrottleProfile] = {
+    "desktop": ThrottleProfile("desktop"),
+    "mid_tier_fast_3g": ThrottleProfile("mid_tier_fast_3g", cpu_rate=4, latency_ms=562.5,
+                                        download_bps=180_000, upload_bps=84_375),
+    "low_end_slow_3g": ThrottleProfile("low_end_slow_3g", cpu_rate=6, latency_ms=2000,
+                                       download_bps=50_000, upload_bps=50_000),
+}
+
+
+def budget_for(limit, profile: str) -> Optional[float]:
+    """A budget is either one number for every profile or a {profile: number} mapping."""
+    return limit.get(profile) if isinstance(limit, dict) else limit
+
+
+def load_metric_records(directory: Path = COMPARISON_DIR, since: float = 0.0) -> List[dict]:
+    """Every metrics record the workers wrote at or after `since` (a time.time() timestamp)."""
+    records = []
+    for path in sorted(directory.glob("metrics-*.jsonl")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            record = json.loads(line)
+            if record["timestamp"] >= since:
+                records.append(record)
+    return records
+
+
+def compare_profiles(records: Iterable[dict]) -> Dict[str, Dict[str, dict]]:
+    """Join records by comparison key into {key: {profile: metrics}}, keeping keys run under several profiles.
+
+    Profile variants of one test usually run on different xdist workers, so the
+    join happens over the workers' files rather than inside any one of them.
+    The latest record wins when a key and profile ran more than once.
+    """
+    runs: Dict[str, Dict[str, dict]] = {}
+    for record in sorted(records, key=lambda r: r["timestamp"]):
+        key = record.get("comparison_key", record["test"])
+        runs.setdefault(key, {})[record["throttle_profile"]] = record["metrics"]
+    return {key: profiles for key, profiles in runs.items() if len(profiles) > 1}
+
+
+def save_comparison(compared: Dict[str, Dict[str, dict]], directory: Path = COMPARISON_DIR) -> Optional[Path]:
+    if not compared:
+        return None
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "profile-comparison.json"
+    path.write_text(json.dumps(compared, indent=2), encoding="utf-8")
+    for key, runs in compared.items():
+        loads = ", ".join(f"{profile}={m.get('load_event_end') or 0:.0f} ms" for profile, m in runs.items())
+        log.info(f"{key} load_event_end by profile: {loads}")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare collected metrics across throttle profiles")
+    parser.add_argument("--since", type=float, default=0.0, help="only records at or after this Unix time")
+    args = parser.parse_args()
+
+    path = save_comparison(compare_profiles(load_metric_records(since=args.since)))
+    print(f"Profile comparison written to {path}" if path else "No test ran under more than one profile")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from playwright.sync_api import BrowserContext
+
+log = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TRACE_MODES = ("off", "on-failure", "first-retry", "always")
+
+
+def trace_mode() -> str:
+    """Return TRACE_MODE from the environment (defaults to on-failure)."""
+    mode = os.getenv("TRACE_MODE", "on-failure").lower()
+    if mode not in TRACE_MODES:
+        raise ValueError(f"TRACE_MODE must be one of {TRACE_MODES}, got '{mode}'")
+    return mode
+
+
+def artifact_path(kind: str, test_id: str, suffix: str) -> Path:
+    """Build a per-worker, per-test artifact path such as trace/gw0/tests_test_tasks.py_test_x.zip."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    safe_name = re.sub(r"[^\w.-]+", "_", test_id).strip("_")
+    path = PROJECT_ROOT / kind / worker / f"{safe_name}{suffix}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class TraceRecorder:
+    """Starts Playwright tracing only when the capture policy may need it.
+
+    Every test under on-failure pays for recording, so that mode records only
+    actions, console and network; always and first-retry also record the
+    screencast, DOM snapshots and sources. The driver writes the trace while
+    the test runs and stop() keeps the zip only when the policy asks for it.
+    """
+
+    def __init__(self, context: BrowserContext, mode: str, attempt: int = 1):
+        self.context = context
+        self.mode = mode
+        self.attempt = attempt
+        self.recording = False
+
+    def start(self):
+        if self.mode == "always" or (self.mode == "first-retry" and self.attempt == 2):
+            self.context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            self.recording = True
+        elif self.mode == "on-failure":
+            self.context.tracing.start(screenshots=False, snapshots=False, sources=False)
+            self.recording = True
+
+    def stop(self, test_id: str, failed: bool) -> Optional[Path]:
+        """Stop recording, returning the written trace path if the policy kept it."""
+        if not self.recording:
+            return None
+        self.recording = False
+        if self.mode == "on-failure" and not failed:
+            self.context.tracing.stop()
+            return None
+        path = artifact_path("trace", test_id, ".zip")
+        self.context.tracing.stop(path=str(path))
+        log.info(f"Trace saved to {path}")
+        return path